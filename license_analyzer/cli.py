@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
 import sys
+import tempfile
 from pathlib import Path
-from typing import Literal, Optional, cast
+from typing import Callable, Literal, Optional, TextIO, cast
 
 import click
 from rich.console import Console
@@ -444,11 +446,15 @@ def matrix(
         sys.exit(EXIT_ERROR)
 
 
-def _write_output_to_file(content: str, path: str) -> None:
+def _write_output_to_file(content: str | Callable[[TextIO], None], path: str) -> None:
     """Write report content to file.
 
+    The report is written to a temporary file in the same directory and then
+    moved over the target, so a failed write leaves any existing file intact.
+
     Args:
-        content: The report content to write.
+        content: The report content to write, or a function that writes the
+            report to the open text stream it is given.
         path: The file path to write to.
 
     Raises:
@@ -456,17 +462,31 @@ def _write_output_to_file(content: str, path: str) -> None:
     """
     file_path = Path(path)
 
+    if file_path.exists():
+        _console.print(f"[yellow]Warning: Overwriting existing file: {path}[/yellow]")
+
     try:
-        if file_path.exists():
-            _console.print(
-                f"[yellow]Warning: Overwriting existing file: {path}[/yellow]"
-            )
+        fd, tmp_name = tempfile.mkstemp(
+            dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp"
+        )
+    except OSError as e:
+        raise ConfigurationError(f"Cannot write to file '{path}': {e}") from e
 
-        file_path.write_text(content, encoding="utf-8")
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            if isinstance(content, str):
+                fp.write(content)
+            else:
+                content(fp)
         # Set appropriate permissions (user read/write, group/other read)
-        file_path.chmod(0o644)
-    except (OSError, PermissionError) as e:
-        raise ConfigurationError(f"Cannot write to file '{path}': {e}") from e
+        tmp_path.chmod(0o644)
+        os.replace(tmp_path, file_path)
+    except BaseException as e:
+        tmp_path.unlink(missing_ok=True)
+        if isinstance(e, OSError):
+            raise ConfigurationError(f"Cannot write to file '{path}': {e}") from e
+        raise
 
     _console.print(f"[green]Report written to {path}[/green]")
 
@@ -608,7 +628,14 @@ def _display_result(
     """
     # Get formatted content based on format type
     if options.format == "json":
-        content = ScanJsonFormatter().format_scan_result(result)
+        json_formatter = ScanJsonFormatter()
+        if output_path:
+            # Write straight to the file instead of building the whole string
+            _write_output_to_file(
+                lambda fp: json_formatter.write_scan_result(result, fp), output_path
+            )
+            return
+        content = json_formatter.format_scan_result(result)
     elif options.format == "markdown":
         content = ScanMarkdownFormatter().format_scan_result(result)
     else:  # terminal
@@ -5,6 +5,7 @@ Includes circular dependency detection and tracking (FR8).
 Includes license compatibility checking models (FR13).
 """
 
+from collections import Counter
 from enum import Enum
 from typing import Optional
 
@@ -509,6 +510,17 @@ class CompatibilityMatrix(BaseModel):
         """Number of unique licenses in the matrix."""
         return len(self.licenses)
 
+    def issue_counts(self) -> "Counter[CompatibilityStatus]":
+        """Count issues by compatibility status.
+
+        Counts the deduplicated issue pairs rather than matrix cells, so a
+        symmetric incompatible pair is counted once.
+
+        Returns:
+            Counter mapping each CompatibilityStatus to its number of issues.
+        """
+        return Counter(issue.status for issue in self.issues)
+
     def get_status(self, license_a: str, license_b: str) -> CompatibilityStatus:
         """Get compatibility status between two licenses.
 
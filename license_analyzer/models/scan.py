@@ -80,6 +80,20 @@ class PackageLicense(BaseModel):
         """
         return self.override_reason is not None
 
+    @property
+    def has_license(self) -> bool:
+        """Check if a license was detected or set for this package.
+
+        Returns:
+            True if license is a non-empty string, False for None or "".
+        """
+        return bool(self.license)
+
+
+def _sorted_by_name(packages: list[PackageLicense]) -> list[PackageLicense]:
+    """Return packages sorted case-insensitively by name, the report order."""
+    return sorted(packages, key=lambda p: p.name.lower())
+
 
 class ScanResult(BaseModel):
     """Result of a license scan operation."""
@@ -116,6 +130,8 @@ class ScanResult(BaseModel):
 
         Calculates issues_found based on packages with no license (license=None).
         Does not perform policy checking - use from_packages_with_config for that.
+        Packages are stored sorted by name, so the formatters' own sorts only
+        have to confirm the order.
 
         Args:
             packages: List of packages with license information.
@@ -124,9 +140,9 @@ class ScanResult(BaseModel):
             ScanResult with calculated totals and issues.
         """
         # Count packages with no license (None or empty string) as issues
-        issues = sum(1 for pkg in packages if not pkg.license)
+        issues = sum(1 for pkg in packages if not pkg.has_license)
         return cls(
-            packages=packages,
+            packages=_sorted_by_name(packages),
             total_packages=len(packages),
             issues_found=issues,
         )
@@ -142,6 +158,7 @@ class ScanResult(BaseModel):
 
         Calculates issues_found based on packages with no license,
         and checks packages against allowed licenses configuration.
+        Packages are stored sorted by name, as in from_packages.
 
         Args:
             packages: List of packages with license information.
@@ -153,11 +170,11 @@ class ScanResult(BaseModel):
         """
         from license_analyzer.analysis.policy import check_allowed_licenses
 
-        issues = sum(1 for pkg in packages if not pkg.license)
+        issues = sum(1 for pkg in packages if not pkg.has_license)
         violations = check_allowed_licenses(packages, config)
 
         return cls(
-            packages=packages,
+            packages=_sorted_by_name(packages),
             total_packages=len(packages),
             issues_found=issues,
             policy_violations=violations,
@@ -0,0 +1,146 @@
+"""JSON serialization helper shared by the JSON output formatters.
+
+Uses the fastest encoder that is installed, in order: orjson, ujson,
+python-rapidjson, then the standard library json module. Whichever is used,
+the text is identical to json.dumps(data, indent=2): two-space indentation
+and non-ASCII characters escaped as \\uXXXX, so reports stay pure ASCII.
+"""
+
+import json
+import re
+from collections.abc import Sequence
+from typing import Any, Callable, TextIO
+
+_Dumps = Callable[[Any], str]
+_Dump = Callable[[Any, TextIO], None]
+
+# Outside strings JSON is pure ASCII, so every match is inside a string
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+
+
+def _escape_char(match: re.Match[str]) -> str:
+    """Escape one non-ASCII character the way json.dumps does."""
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # Astral characters become a UTF-16 surrogate pair
+        code -= 0x10000
+        high, low = 0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF)
+        return f"\\u{high:04x}\\u{low:04x}"
+    return f"\\u{code:04x}"
+
+
+def _escape_non_ascii(text: str) -> str:
+    """Escape non-ASCII characters in encoder output, matching ensure_ascii."""
+    if text.isascii():
+        return text
+    return _NON_ASCII_RE.sub(_escape_char, text)
+
+
+def _write_with(dumps: _Dumps) -> _Dump:
+    """Build a stream writer for an encoder that has no incremental mode."""
+
+    def dump(data: Any, fp: TextIO) -> None:
+        fp.write(dumps(data))
+
+    return dump
+
+
+def _orjson_encoder() -> tuple[_Dumps, _Dump]:
+    """Build the orjson encoder; raises ImportError if it is missing."""
+    import orjson
+
+    def dumps(data: Any) -> str:
+        # orjson always writes UTF-8 and has no ensure_ascii option
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        return _escape_non_ascii(text)
+
+    return dumps, _write_with(dumps)
+
+
+def _ujson_encoder() -> tuple[_Dumps, _Dump]:
+    """Build the ujson encoder; raises ImportError if it is missing."""
+    import ujson
+
+    def dumps(data: Any) -> str:
+        # ujson escapes "/" by default; keep URLs readable like the others
+        return str(ujson.dumps(data, indent=2, escape_forward_slashes=False))
+
+    # ujson.dump encodes the whole document before writing it anyway
+    return dumps, _write_with(dumps)
+
+
+def _rapidjson_encoder() -> tuple[_Dumps, _Dump]:
+    """Build the python-rapidjson encoder; raises ImportError if missing."""
+    import rapidjson
+
+    def dumps(data: Any) -> str:
+        # rapidjson's own escapes use uppercase hex, unlike json.dumps
+        text = rapidjson.dumps(data, indent=2, ensure_ascii=False)
+        return _escape_non_ascii(str(text))
+
+    return dumps, _write_with(dumps)
+
+
+def _stdlib_dumps(data: Any) -> str:
+    return json.dumps(data, indent=2)
+
+
+def _stdlib_dump(data: Any, fp: TextIO) -> None:
+    # json.dump writes iterencode() chunks as they are produced
+    json.dump(data, fp, indent=2)
+
+
+# Optional encoders in order of preference
+_ENCODERS: dict[str, Callable[[], tuple[_Dumps, _Dump]]] = {
+    "orjson": _orjson_encoder,
+    "ujson": _ujson_encoder,
+    "rapidjson": _rapidjson_encoder,
+}
+
+
+def _select_encoder(backends: Sequence[str] = tuple(_ENCODERS)) -> tuple[_Dumps, _Dump]:
+    """Pick the first installed encoder, falling back to the standard library.
+
+    Args:
+        backends: Names of optional encoders to try, in order.
+
+    Returns:
+        Pair of functions serializing data to a JSON string and writing it
+        to a text stream, respectively.
+    """
+    for name in backends:
+        try:
+            return _ENCODERS[name]()
+        except ImportError:
+            continue
+    return _stdlib_dumps, _stdlib_dump
+
+
+# Resolved once at import; reassign from _select_encoder() to switch backends
+_encode, _encode_to = _select_encoder()
+
+
+def dumps(data: Any) -> str:
+    """Serialize data as pretty-printed JSON.
+
+    Args:
+        data: JSON-compatible data (dicts, lists, strings, numbers, None).
+
+    Returns:
+        JSON string indented with two spaces.
+    """
+    return _encode(data)
+
+
+def dump(data: Any, fp: TextIO) -> None:
+    """Write data as pretty-printed JSON to a text stream.
+
+    Produces the same text as dumps(). Only the standard library encoder
+    writes the output in chunks as it encodes it; the optional encoders
+    build the full JSON string before writing it.
+
+    Args:
+        data: JSON-compatible data (dicts, lists, strings, numbers, None).
+        fp: Writable text stream.
+    """
+    _encode_to(data, fp)
@@ -104,11 +104,7 @@ class MatrixFormatter:
             self._console.print("[yellow]No licenses found[/yellow]")
             return
 
-        incompatible_count = sum(
-            1
-            for issue in matrix.issues
-            if issue.status == CompatibilityStatus.INCOMPATIBLE
-        )
+        incompatible_count = matrix.issue_counts()[CompatibilityStatus.INCOMPATIBLE]
 
         if incompatible_count > 0:
             self._console.print(
@@ -154,14 +150,9 @@ class MatrixFormatter:
         self._console.print()
         self._console.print(f"[bold]Total licenses:[/bold] {matrix.size}")
 
-        incompatible_count = sum(
-            1
-            for issue in matrix.issues
-            if issue.status == CompatibilityStatus.INCOMPATIBLE
-        )
-        unknown_count = sum(
-            1 for issue in matrix.issues if issue.status == CompatibilityStatus.UNKNOWN
-        )
+        status_counts = matrix.issue_counts()
+        incompatible_count = status_counts[CompatibilityStatus.INCOMPATIBLE]
+        unknown_count = status_counts[CompatibilityStatus.UNKNOWN]
 
         if incompatible_count > 0:
             self._console.print(
@@ -1,12 +1,15 @@
 """JSON matrix formatter for license compatibility visualization."""
 
-import json
 from typing import Any
 
 from license_analyzer.models.dependency import (
     CompatibilityMatrix,
     CompatibilityStatus,
 )
+from license_analyzer.output._json import dumps
+
+# Serialized form of each status, resolved once instead of per cell
+_STATUS_VALUES = {status: status.value for status in CompatibilityStatus}
 
 
 class MatrixJsonFormatter:
@@ -26,7 +29,7 @@ class MatrixJsonFormatter:
             JSON string representation of the matrix.
         """
         output = self._build_output(matrix)
-        return json.dumps(output, indent=2)
+        return dumps(output)
 
     def _build_output(self, matrix: CompatibilityMatrix) -> dict[str, Any]:
         """Build the output dictionary structure.
@@ -38,19 +41,14 @@ class MatrixJsonFormatter:
             Dictionary ready for JSON serialization.
         """
         # Convert matrix to string statuses
-        matrix_data: list[list[str]] = []
-        for row in matrix.matrix:
-            matrix_data.append([status.value for status in row])
+        matrix_data = [
+            [_STATUS_VALUES[status] for status in row] for row in matrix.matrix
+        ]
 
         # Count issues by type
-        incompatible_count = sum(
-            1
-            for issue in matrix.issues
-            if issue.status == CompatibilityStatus.INCOMPATIBLE
-        )
-        unknown_count = sum(
-            1 for issue in matrix.issues if issue.status == CompatibilityStatus.UNKNOWN
-        )
+        status_counts = matrix.issue_counts()
+        incompatible_count = status_counts[CompatibilityStatus.INCOMPATIBLE]
+        unknown_count = status_counts[CompatibilityStatus.UNKNOWN]
 
         return {
             "licenses": matrix.licenses,
@@ -27,6 +27,12 @@ class MatrixMarkdownFormatter:
         CompatibilityStatus.UNKNOWN: "??",
     }
 
+    # Status badges; the summary only ever picks one of these two
+    BADGE_PASSING = (
+        "![Status](https://img.shields.io/badge/Compatibility-passing-green)"
+    )
+    BADGE_FAILING = "![Status](https://img.shields.io/badge/Compatibility-failing-red)"
+
     def __init__(self, use_emoji: bool = True) -> None:
         """Initialize the formatter.
 
@@ -82,22 +88,16 @@ class MatrixMarkdownFormatter:
         Returns:
             List of Markdown lines for summary.
         """
-        incompatible_count = sum(
-            1
-            for issue in matrix.issues
-            if issue.status == CompatibilityStatus.INCOMPATIBLE
-        )
-        unknown_count = sum(
-            1 for issue in matrix.issues if issue.status == CompatibilityStatus.UNKNOWN
-        )
-
-        status = "passing" if incompatible_count == 0 else "failing"
-        status_color = "green" if incompatible_count == 0 else "red"
+        status_counts = matrix.issue_counts()
+        incompatible_count = status_counts[CompatibilityStatus.INCOMPATIBLE]
+        unknown_count = status_counts[CompatibilityStatus.UNKNOWN]
+
+        badge = self.BADGE_PASSING if incompatible_count == 0 else self.BADGE_FAILING
 
         lines = [
             "## Summary",
             "",
-            f"![Status](https://img.shields.io/badge/Compatibility-{status}-{status_color})",
+            badge,
             "",
             "| Metric | Value |",
             "|--------|-------|",
@@ -118,25 +118,20 @@ class MatrixMarkdownFormatter:
         """
         lines = ["## Compatibility Matrix", ""]
 
+        # Truncate each name once; it is reused as column and row header
+        short_names = [self._truncate(name) for name in matrix.licenses]
+
         # Header row
-        header = "| |"
-        for license_name in matrix.licenses:
-            header += f" {self._truncate(license_name)} |"
-        lines.append(header)
+        lines.append("| |" + "".join(f" {name} |" for name in short_names))
 
         # Separator row
-        separator = "|---|"
-        for _ in matrix.licenses:
-            separator += "---|"
-        lines.append(separator)
-
-        # Data rows
-        for i, row_license in enumerate(matrix.licenses):
-            row = f"| **{self._truncate(row_license)}** |"
-            for status in matrix.matrix[i]:
-                indicator = self._indicators[status]
-                row += f" {indicator} |"
-            lines.append(row)
+        lines.append("|---|" + "---|" * matrix.size)
+
+        # Data rows: one table lookup per cell, bound locally for the loop
+        indicators = self._indicators
+        for short_name, statuses in zip(short_names, matrix.matrix):
+            cells = "".join(f" {indicators[status]} |" for status in statuses)
+            lines.append(f"| **{short_name}** |{cells}")
 
         return lines
 
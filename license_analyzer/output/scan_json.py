@@ -1,12 +1,19 @@
 """JSON output formatter for license scan results."""
 
-import json
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TextIO
 
 from license_analyzer import __version__
 from license_analyzer.constants import LEGAL_DISCLAIMER
-from license_analyzer.models.scan import ScanResult
+from license_analyzer.models.scan import PackageLicense, ScanResult
+from license_analyzer.output._json import dump, dumps
+
+# Metadata fields that are fixed for the life of the process
+_STATIC_METADATA: dict[str, Any] = {
+    "tool_version": __version__,
+    "disclaimer": LEGAL_DISCLAIMER,
+    "disclaimer_type": "informational",
+}
 
 
 class ScanJsonFormatter:
@@ -26,7 +33,21 @@ class ScanJsonFormatter:
             JSON string representation of the scan result.
         """
         output = self._build_output(result)
-        return json.dumps(output, indent=2)
+        return dumps(output)
+
+    def write_scan_result(self, result: ScanResult, fp: TextIO) -> None:
+        """Write scan result as JSON to a text stream.
+
+        Produces the same text as format_scan_result(). With the standard
+        library encoder the text is written in chunks rather than built as
+        one string first, which keeps memory flat for very large scans; the
+        optional encoders build the whole string. See output._json.dump().
+
+        Args:
+            result: The scan result to format.
+            fp: Writable text stream, e.g. an open file or sys.stdout.
+        """
+        dump(self._build_output(result), fp)
 
     def _build_output(self, result: ScanResult) -> dict[str, Any]:
         """Build the output dictionary structure.
@@ -37,27 +58,27 @@ class ScanJsonFormatter:
         Returns:
             Dictionary ready for JSON serialization.
         """
+        # Sort once; issues are a filtered view and inherit this order
+        sorted_packages = sorted(result.packages, key=lambda p: p.name.lower())
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         return {
-            "scan_metadata": self._build_scan_metadata(),
+            "scan_metadata": self._build_scan_metadata(timestamp),
             "summary": self._build_summary(result),
-            "packages": self._build_packages(result),
-            "issues": self._build_issues(result),
+            "packages": self._build_packages(sorted_packages),
+            "issues": self._build_issues(sorted_packages),
             "policy_violations": self._build_policy_violations(result),
         }
 
-    def _build_scan_metadata(self) -> dict[str, Any]:
+    def _build_scan_metadata(self, timestamp: str) -> dict[str, Any]:
         """Build scan metadata section.
 
+        Args:
+            timestamp: UTC generation time, YYYY-MM-DDTHH:MM:SSZ.
+
         Returns:
             Dictionary with scan metadata including legal disclaimer (FR19).
         """
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        return {
-            "generated_at": timestamp,
-            "tool_version": __version__,
-            "disclaimer": LEGAL_DISCLAIMER,
-            "disclaimer_type": "informational",
-        }
+        return {"generated_at": timestamp, **_STATIC_METADATA}
 
     def _build_summary(self, result: ScanResult) -> dict[str, Any]:
         """Build summary section.
@@ -105,23 +126,23 @@ class ScanJsonFormatter:
             "status_message": status_message,
         }
 
-    def _build_packages(self, result: ScanResult) -> list[dict[str, Any]]:
+    def _build_packages(
+        self, sorted_packages: list[PackageLicense]
+    ) -> list[dict[str, Any]]:
         """Build packages array.
 
         Args:
-            result: The scan result.
+            sorted_packages: Scanned packages, already sorted alphabetically.
 
         Returns:
-            List of package dictionaries sorted alphabetically.
+            List of package dictionaries in the given order.
         """
-        sorted_packages = sorted(result.packages, key=lambda p: p.name.lower())
-
         return [
             {
                 "name": pkg.name,
                 "version": pkg.version,
                 "license": pkg.license,
-                "has_license": bool(pkg.license),
+                "has_license": pkg.has_license,
                 "original_license": pkg.original_license,
                 "override_reason": pkg.override_reason,
                 "is_overridden": pkg.is_overridden,
@@ -129,18 +150,18 @@ class ScanJsonFormatter:
             for pkg in sorted_packages
         ]
 
-    def _build_issues(self, result: ScanResult) -> list[dict[str, Any]]:
+    def _build_issues(
+        self, sorted_packages: list[PackageLicense]
+    ) -> list[dict[str, Any]]:
         """Build issues array.
 
         Args:
-            result: The scan result.
+            sorted_packages: Scanned packages, already sorted alphabetically.
 
         Returns:
-            List of issue dictionaries.
+            List of issue dictionaries for packages without a license, in the
+            same order as the packages array.
         """
-        packages_with_issues = [pkg for pkg in result.packages if not pkg.license]
-        sorted_issues = sorted(packages_with_issues, key=lambda p: p.name.lower())
-
         return [
             {
                 "package": pkg.name,
@@ -148,7 +169,8 @@ class ScanJsonFormatter:
                 "issue_type": "no_license",
                 "suggestion": "Check package documentation or PyPI page",
             }
-            for pkg in sorted_issues
+            for pkg in sorted_packages
+            if not pkg.has_license
         ]
 
     def _build_policy_violations(self, result: ScanResult) -> list[dict[str, Any]]:
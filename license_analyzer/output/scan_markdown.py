@@ -13,6 +13,18 @@ class ScanMarkdownFormatter:
     suitable for legal review and documentation (FR16).
     """
 
+    # Legal disclaimer block (FR19), identical in every report
+    DISCLAIMER_LINES = (
+        "> **NOT LEGAL ADVICE**",
+        ">",
+        f"> {LEGAL_DISCLAIMER}",
+    )
+
+    BADGE_PASSING = (
+        "![Status](https://img.shields.io/badge/License%20Scan-passing-green)"
+    )
+    BADGE_FAILING = "![Status](https://img.shields.io/badge/License%20Scan-failing-red)"
+
     def format_scan_result(self, result: ScanResult) -> str:
         """Format scan result as Markdown string.
 
@@ -35,26 +47,30 @@ class ScanMarkdownFormatter:
 
         if result.total_packages == 0:
             # Still show disclaimer even for empty results (FR19)
-            lines.extend(self._format_disclaimer())
+            lines.extend(self.DISCLAIMER_LINES)
             lines.append("")
             lines.append("*No packages found.*")
             return "\n".join(lines)
 
+        # Sort once; the issues, packages and overrides sections are all
+        # alphabetical, so they share this order instead of re-sorting
+        sorted_packages = sorted(result.packages, key=lambda p: p.name.lower())
+
         # Executive summary (FR18 - appears at top of reports)
         lines.extend(self._format_executive_summary(result))
         lines.append("")
 
         # Legal disclaimer (FR19)
-        lines.extend(self._format_disclaimer())
+        lines.extend(self.DISCLAIMER_LINES)
         lines.append("")
 
         # Status badge
-        lines.extend(self._format_status_badge(result))
+        lines.append(self.BADGE_FAILING if result.has_issues else self.BADGE_PASSING)
         lines.append("")
 
         # Issues section (prominently placed after executive summary)
         if result.issues_found > 0:
-            lines.extend(self._format_issues(result))
+            lines.extend(self._format_issues(result, sorted_packages))
             lines.append("")
 
         # Policy violations section (FR23)
@@ -63,11 +79,11 @@ class ScanMarkdownFormatter:
             lines.append("")
 
         # Packages table
-        lines.extend(self._format_packages(result))
+        lines.extend(self._format_packages(sorted_packages))
         lines.append("")
 
         # Overrides Applied section (FR25)
-        overridden_packages = [pkg for pkg in result.packages if pkg.is_overridden]
+        overridden_packages = [pkg for pkg in sorted_packages if pkg.is_overridden]
         if overridden_packages:
             lines.extend(self._format_overrides(overridden_packages))
             lines.append("")
@@ -144,50 +160,17 @@ class ScanMarkdownFormatter:
 
         return lines
 
-    def _format_disclaimer(self) -> list[str]:
-        """Format legal disclaimer section.
-
-        Provides a prominent disclaimer that this is not legal advice (FR19).
-
-        Returns:
-            List of Markdown lines for disclaimer.
-        """
-        return [
-            "> **NOT LEGAL ADVICE**",
-            ">",
-            f"> {LEGAL_DISCLAIMER}",
-        ]
-
-    def _format_status_badge(self, result: ScanResult) -> list[str]:
-        """Format status badge section.
-
-        Args:
-            result: The scan result.
-
-        Returns:
-            List of Markdown lines for status badge.
-        """
-        if result.has_issues:
-            status = "failing"
-            color = "red"
-        else:
-            status = "passing"
-            color = "green"
-
-        badge_url = f"https://img.shields.io/badge/License%20Scan-{status}-{color}"
-        return [f"![Status]({badge_url})"]
-
-    def _format_packages(self, result: ScanResult) -> list[str]:
+    def _format_packages(self, sorted_packages: list[PackageLicense]) -> list[str]:
         """Format packages table section.
 
         Args:
-            result: The scan result.
+            sorted_packages: Scanned packages, already sorted alphabetically.
 
         Returns:
             List of Markdown lines for packages table.
         """
         # Check if any packages have overrides to determine column structure
-        has_overrides = any(pkg.is_overridden for pkg in result.packages)
+        has_overrides = any(pkg.is_overridden for pkg in sorted_packages)
 
         if has_overrides:
             lines = [
@@ -204,9 +187,6 @@ class ScanMarkdownFormatter:
                 "|---------|---------|---------|",
             ]
 
-        # Sort packages alphabetically by name
-        sorted_packages = sorted(result.packages, key=lambda p: p.name.lower())
-
         for pkg in sorted_packages:
             license_display = pkg.license if pkg.license else "⚠️ Unknown"
             if has_overrides:
@@ -223,11 +203,14 @@ class ScanMarkdownFormatter:
 
         return lines
 
-    def _format_issues(self, result: ScanResult) -> list[str]:
+    def _format_issues(
+        self, result: ScanResult, sorted_packages: list[PackageLicense]
+    ) -> list[str]:
         """Format issues section.
 
         Args:
             result: The scan result.
+            sorted_packages: Scanned packages, already sorted alphabetically.
 
         Returns:
             List of Markdown lines for issues section.
@@ -241,11 +224,8 @@ class ScanMarkdownFormatter:
             "|---------|---------|-------|------------|",
         ]
 
-        # Find packages with issues (no license)
-        packages_with_issues = [pkg for pkg in result.packages if not pkg.license]
-
-        # Sort alphabetically
-        sorted_issues = sorted(packages_with_issues, key=lambda p: p.name.lower())
+        # Packages with issues (no license), in package order
+        sorted_issues = [pkg for pkg in sorted_packages if not pkg.has_license]
 
         for pkg in sorted_issues:
             suggestion = "Check package documentation or PyPI page"
@@ -291,7 +271,7 @@ class ScanMarkdownFormatter:
         """Format overrides applied section.
 
         Args:
-            overridden_packages: List of packages with overrides applied.
+            overridden_packages: Packages with overrides applied, sorted by name.
 
         Returns:
             List of Markdown lines for overrides section.
@@ -307,10 +287,7 @@ class ScanMarkdownFormatter:
             "|---------|----------|----------|--------|",
         ]
 
-        # Sort by package name
-        sorted_overrides = sorted(overridden_packages, key=lambda p: p.name.lower())
-
-        for pkg in sorted_overrides:
+        for pkg in overridden_packages:
             original = pkg.original_license or "Unknown"
             override_license = pkg.license or "Unknown"
             reason = pkg.override_reason or ""
@@ -107,9 +107,10 @@ class TerminalFormatter:
             self._console.print(
                 f"[red]ISSUES FOUND[/red] - {total_issues} issue(s) require attention"
             )
-            # List packages with missing licenses
+            # List packages with missing licenses in stored order, which is
+            # alphabetical for results built by the ScanResult factories
             for pkg in result.packages:
-                if not pkg.license:
+                if not pkg.has_license:
                     msg = f"  - {pkg.name}@{pkg.version}: "
                     msg += "[yellow]No license found[/yellow]"
                     self._console.print(msg)
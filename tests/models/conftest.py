@@ -0,0 +1,38 @@
+"""Shared fixtures for model tests."""
+
+from typing import Optional
+
+import pytest
+
+from license_analyzer.models.dependency import DependencyNode, DependencyTree
+from tests.models.helpers import NestedTreeFactory
+
+
+@pytest.fixture(scope="session")
+def nested_tree_factory() -> NestedTreeFactory:
+    """Build two-level trees (one root, one child) with the given licenses.
+
+    Nodes are created with model_construct to skip validation of the
+    nested children list; the topology is identical for every caller.
+    """
+
+    def build(
+        root_license: Optional[str], child_license: Optional[str]
+    ) -> DependencyTree:
+        child = DependencyNode.model_construct(
+            name="child-pkg",
+            version="1.0.0",
+            depth=1,
+            license=child_license,
+            children=[],
+        )
+        root = DependencyNode.model_construct(
+            name="root-pkg",
+            version="1.0.0",
+            depth=0,
+            license=root_license,
+            children=[child],
+        )
+        return DependencyTree.model_construct(roots=[root])
+
+    return build
@@ -0,0 +1,8 @@
+"""Helpers shared by the model test modules."""
+
+from typing import Callable, Optional
+
+from license_analyzer.models.dependency import DependencyTree
+
+# Signature of the nested_tree_factory fixture: (root_license, child_license)
+NestedTreeFactory = Callable[[Optional[str], Optional[str]], DependencyTree]
@@ -1,17 +1,28 @@
 """Tests for dependency tree models."""
 
+from typing import Any
+
 import pytest
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from license_analyzer.models.dependency import (
     CategoryStatistics,
     CircularReference,
+    CompatibilityMatrix,
     CompatibilityResult,
     CompatibilityStatus,
     DependencyNode,
     DependencyTree,
     LicenseStatistics,
 )
+from tests.models.helpers import NestedTreeFactory
+
+
+def _assert_forbids_extra(model_cls: type[BaseModel], **kwargs: Any) -> None:
+    """Assert that model_cls rejects an unknown field alongside valid kwargs."""
+    with pytest.raises(ValidationError) as exc_info:
+        model_cls(**kwargs, extra_field="not allowed")
+    assert "extra" in str(exc_info.value).lower()
 
 
 class TestDependencyNode:
@@ -97,16 +108,6 @@ class TestDependencyNode:
         assert child in descendants
         assert grandchild in descendants
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        with pytest.raises(ValidationError):
-            DependencyNode(
-                name="requests",
-                version="2.31.0",
-                depth=0,
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
     def test_depth_must_be_non_negative(self) -> None:
         """Test that negative depth values are rejected."""
         with pytest.raises(ValidationError):
@@ -271,14 +272,6 @@ class TestDependencyTree:
         tree = DependencyTree()
         assert tree.max_depth == 0
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        with pytest.raises(ValidationError):
-            DependencyTree(
-                roots=[],
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
     def test_multiple_roots_with_shared_names(self) -> None:
         """Test tree with multiple root packages."""
         root1 = DependencyNode(name="requests", version="2.31.0", depth=0)
@@ -786,31 +779,21 @@ class TestCompatibilityResult:
         assert result.status == CompatibilityStatus.UNKNOWN
         assert result.compatible is False
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        with pytest.raises(ValidationError):
-            CompatibilityResult(
-                license_a="MIT",
-                license_b="Apache-2.0",
-                status=CompatibilityStatus.COMPATIBLE,
-                reason="Both permissive",
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
-    def test_model_serialization(self) -> None:
-        """Test CompatibilityResult serialization."""
+    def test_model_dump_shape(self) -> None:
+        """Test CompatibilityResult serializes to the expected dict."""
         result = CompatibilityResult(
             license_a="MIT",
             license_b="GPL-3.0",
             status=CompatibilityStatus.COMPATIBLE,
             reason="MIT can be used in GPL projects",
         )
-        dumped = result.model_dump()
-        assert dumped["license_a"] == "MIT"
-        assert dumped["license_b"] == "GPL-3.0"
-        assert dumped["status"] == CompatibilityStatus.COMPATIBLE
-        assert dumped["reason"] == "MIT can be used in GPL projects"
-        assert dumped["compatible"] is True
+        assert result.model_dump() == {
+            "license_a": "MIT",
+            "license_b": "GPL-3.0",
+            "status": CompatibilityStatus.COMPATIBLE,
+            "reason": "MIT can be used in GPL projects",
+            "compatible": True,
+        }
 
 
 class TestCircularReference:
@@ -823,26 +806,19 @@ class TestCircularReference:
             to_package="A",
             path=["A", "B", "A"],
         )
-        assert circ.from_package == "B"
-        assert circ.to_package == "A"
-        assert circ.path == ["A", "B", "A"]
+        assert (circ.from_package, circ.to_package, circ.path) == (
+            "B",
+            "A",
+            ["A", "B", "A"],
+        )
 
     def test_path_defaults_to_empty(self) -> None:
         """Test that path defaults to empty list."""
         circ = CircularReference(from_package="B", to_package="A")
         assert circ.path == []
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        with pytest.raises(ValidationError):
-            CircularReference(
-                from_package="B",
-                to_package="A",
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
-    def test_model_serialization(self) -> None:
-        """Test CircularReference serialization."""
+    def test_model_dump_shape(self) -> None:
+        """Test CircularReference serializes to the expected dict."""
         circ = CircularReference(
             from_package="B",
             to_package="A",
@@ -881,16 +857,6 @@ class TestCategoryStatistics:
         )
         assert stats.licenses == []
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        with pytest.raises(ValidationError):
-            CategoryStatistics(
-                category="Permissive",
-                count=1,
-                percentage=100.0,
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
     def test_count_cannot_be_negative(self) -> None:
         """Test that count must be >= 0."""
         with pytest.raises(ValidationError):
@@ -978,31 +944,6 @@ class TestLicenseStatistics:
         assert "weak_copyleft" in result
         assert "unknown" in result
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test that extra fields are forbidden."""
-        permissive = CategoryStatistics(
-            category="Permissive", count=1, percentage=100.0, licenses=["MIT"]
-        )
-        copyleft = CategoryStatistics(
-            category="Copyleft", count=0, percentage=0.0, licenses=[]
-        )
-        weak = CategoryStatistics(
-            category="Weak Copyleft", count=0, percentage=0.0, licenses=[]
-        )
-        unknown = CategoryStatistics(
-            category="Unknown", count=0, percentage=0.0, licenses=[]
-        )
-
-        with pytest.raises(ValidationError):
-            LicenseStatistics(
-                total_packages=1,
-                permissive=permissive,
-                copyleft=copyleft,
-                weak_copyleft=weak,
-                unknown=unknown,
-                extra_field="not allowed",  # type: ignore[call-arg]
-            )
-
     def test_total_packages_cannot_be_negative(self) -> None:
         """Test that total_packages must be >= 0."""
         permissive = CategoryStatistics(
@@ -1028,13 +969,39 @@ class TestLicenseStatistics:
             )
 
 
+@pytest.fixture(scope="class")
+def empty_stats() -> LicenseStatistics:
+    """Statistics for a tree with no packages."""
+    return DependencyTree(roots=[]).get_license_statistics()
+
+
+@pytest.fixture(scope="class")
+def all_permissive_stats() -> LicenseStatistics:
+    """Statistics for a tree of MIT and Apache-2.0 packages."""
+    root1 = DependencyNode(name="pkg-a", version="1.0.0", depth=0, license="MIT")
+    root2 = DependencyNode(name="pkg-b", version="1.0.0", depth=0, license="Apache-2.0")
+    return DependencyTree(roots=[root1, root2]).get_license_statistics()
+
+
+@pytest.fixture(scope="class")
+def mixed_stats() -> LicenseStatistics:
+    """Statistics for one package in each license category."""
+    root1 = DependencyNode(name="mit-pkg", version="1.0.0", depth=0, license="MIT")
+    root2 = DependencyNode(name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0")
+    root3 = DependencyNode(
+        name="lgpl-pkg", version="1.0.0", depth=0, license="LGPL-3.0"
+    )
+    root4 = DependencyNode(name="unknown-pkg", version="1.0.0", depth=0, license=None)
+    tree = DependencyTree(roots=[root1, root2, root3, root4])
+    return tree.get_license_statistics()
+
+
 class TestDependencyTreeLicenseStatistics:
     """Tests for DependencyTree.get_license_statistics()."""
 
-    def test_empty_tree_statistics(self) -> None:
+    def test_empty_tree_statistics(self, empty_stats: LicenseStatistics) -> None:
         """Test statistics for empty tree."""
-        tree = DependencyTree(roots=[])
-        stats = tree.get_license_statistics()
+        stats = empty_stats
 
         assert stats.total_packages == 0
         assert stats.permissive.count == 0
@@ -1042,15 +1009,11 @@ class TestDependencyTreeLicenseStatistics:
         assert stats.weak_copyleft.count == 0
         assert stats.unknown.count == 0
 
-    def test_all_permissive_licenses(self) -> None:
+    def test_all_permissive_licenses(
+        self, all_permissive_stats: LicenseStatistics
+    ) -> None:
         """Test statistics when all licenses are permissive."""
-        root1 = DependencyNode(name="pkg-a", version="1.0.0", depth=0, license="MIT")
-        root2 = DependencyNode(
-            name="pkg-b", version="1.0.0", depth=0, license="Apache-2.0"
-        )
-        tree = DependencyTree(roots=[root1, root2])
-
-        stats = tree.get_license_statistics()
+        stats = all_permissive_stats
 
         assert stats.total_packages == 2
         assert stats.permissive.count == 2
@@ -1058,21 +1021,9 @@ class TestDependencyTreeLicenseStatistics:
         assert "MIT" in stats.permissive.licenses
         assert "Apache-2.0" in stats.permissive.licenses
 
-    def test_mixed_licenses(self) -> None:
+    def test_mixed_licenses(self, mixed_stats: LicenseStatistics) -> None:
         """Test statistics with mixed license types."""
-        root1 = DependencyNode(name="mit-pkg", version="1.0.0", depth=0, license="MIT")
-        root2 = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
-        root3 = DependencyNode(
-            name="lgpl-pkg", version="1.0.0", depth=0, license="LGPL-3.0"
-        )
-        root4 = DependencyNode(
-            name="unknown-pkg", version="1.0.0", depth=0, license=None
-        )
-        tree = DependencyTree(roots=[root1, root2, root3, root4])
-
-        stats = tree.get_license_statistics()
+        stats = mixed_stats
 
         assert stats.total_packages == 4
         assert stats.permissive.count == 1
@@ -1084,19 +1035,11 @@ class TestDependencyTreeLicenseStatistics:
         assert stats.unknown.count == 1
         assert stats.unknown.percentage == 25.0
 
-    def test_nested_tree_statistics(self) -> None:
+    def test_nested_tree_statistics(
+        self, nested_tree_factory: NestedTreeFactory
+    ) -> None:
         """Test statistics include nested children."""
-        child = DependencyNode(
-            name="child-pkg", version="1.0.0", depth=1, license="Apache-2.0"
-        )
-        root = DependencyNode(
-            name="root-pkg",
-            version="1.0.0",
-            depth=0,
-            license="MIT",
-            children=[child],
-        )
-        tree = DependencyTree(roots=[root])
+        tree = nested_tree_factory("MIT", "Apache-2.0")
 
         stats = tree.get_license_statistics()
 
@@ -1193,19 +1136,11 @@ class TestDependencyTreeCompatibilityIssues:
         assert len(issues) == 1
         assert issues[0].status == CompatibilityStatus.INCOMPATIBLE
 
-    def test_nested_tree_collects_all_licenses(self) -> None:
+    def test_nested_tree_collects_all_licenses(
+        self, nested_tree_factory: NestedTreeFactory
+    ) -> None:
         """Test nested tree collects licenses from all depths."""
-        child = DependencyNode(
-            name="gpl3-child", version="1.0.0", depth=1, license="GPL-3.0"
-        )
-        root = DependencyNode(
-            name="gpl2-root",
-            version="1.0.0",
-            depth=0,
-            license="GPL-2.0",
-            children=[child],
-        )
-        tree = DependencyTree(roots=[root])
+        tree = nested_tree_factory("GPL-2.0", "GPL-3.0")
 
         issues = tree.get_compatibility_issues()
         assert len(issues) == 1
@@ -1305,6 +1240,57 @@ class TestCompatibilityMatrix:
 
         assert matrix.has_issues is True
 
+    def test_issue_counts_by_status(self) -> None:
+        """Test issue_counts counts each issue pair once by status."""
+        from license_analyzer.models.dependency import CompatibilityMatrix
+
+        matrix = CompatibilityMatrix(
+            licenses=["GPL-3.0", "MIT", "Unknown-License"],
+            matrix=[
+                [
+                    CompatibilityStatus.COMPATIBLE,
+                    CompatibilityStatus.INCOMPATIBLE,
+                    CompatibilityStatus.UNKNOWN,
+                ],
+                [
+                    CompatibilityStatus.INCOMPATIBLE,
+                    CompatibilityStatus.COMPATIBLE,
+                    CompatibilityStatus.UNKNOWN,
+                ],
+                [
+                    CompatibilityStatus.UNKNOWN,
+                    CompatibilityStatus.UNKNOWN,
+                    CompatibilityStatus.COMPATIBLE,
+                ],
+            ],
+            issues=[
+                CompatibilityResult(
+                    license_a="MIT",
+                    license_b="GPL-3.0",
+                    status=CompatibilityStatus.INCOMPATIBLE,
+                    reason="Copyleft restriction",
+                ),
+                CompatibilityResult(
+                    license_a="GPL-3.0",
+                    license_b="Unknown-License",
+                    status=CompatibilityStatus.UNKNOWN,
+                    reason="Unknown license",
+                ),
+                CompatibilityResult(
+                    license_a="MIT",
+                    license_b="Unknown-License",
+                    status=CompatibilityStatus.UNKNOWN,
+                    reason="Unknown license",
+                ),
+            ],
+        )
+
+        counts = matrix.issue_counts()
+
+        assert counts[CompatibilityStatus.INCOMPATIBLE] == 1
+        assert counts[CompatibilityStatus.UNKNOWN] == 2
+        assert counts[CompatibilityStatus.COMPATIBLE] == 0
+
     def test_get_status_returns_correct_status(self) -> None:
         """Test get_status returns correct status for license pair."""
         from license_analyzer.models.dependency import CompatibilityMatrix
@@ -1339,18 +1325,6 @@ class TestCompatibilityMatrix:
         with pytest.raises(ValueError, match="License not in matrix"):
             matrix.get_status("Unknown", "MIT")
 
-    def test_model_forbids_extra_fields(self) -> None:
-        """Test model rejects extra fields."""
-        from license_analyzer.models.dependency import CompatibilityMatrix
-
-        with pytest.raises(ValidationError):
-            CompatibilityMatrix(
-                licenses=[],
-                matrix=[],
-                issues=[],
-                extra_field="not allowed",
-            )
-
 
 class TestCompatibilityMatrixFromDependencyTree:
     """Tests for CompatibilityMatrix.from_dependency_tree factory method."""
@@ -1469,3 +1443,63 @@ class TestCompatibilityMatrixFromDependencyTree:
         # Diagonal entries should all be compatible
         for i in range(matrix.size):
             assert matrix.matrix[i][i] == CompatibilityStatus.COMPATIBLE
+
+
+_EMPTY_CATEGORY = {"category": "Unknown", "count": 0, "percentage": 0.0}
+
+
+class TestModelsForbidExtraFields:
+    """Tests that every dependency model rejects unknown fields."""
+
+    @pytest.mark.parametrize(
+        ("model_cls", "kwargs"),
+        [
+            pytest.param(
+                DependencyNode,
+                {"name": "requests", "version": "2.31.0", "depth": 0},
+                id="DependencyNode",
+            ),
+            pytest.param(DependencyTree, {"roots": []}, id="DependencyTree"),
+            pytest.param(
+                CompatibilityResult,
+                {
+                    "license_a": "MIT",
+                    "license_b": "Apache-2.0",
+                    "status": CompatibilityStatus.COMPATIBLE,
+                    "reason": "Both permissive",
+                },
+                id="CompatibilityResult",
+            ),
+            pytest.param(
+                CircularReference,
+                {"from_package": "B", "to_package": "A"},
+                id="CircularReference",
+            ),
+            pytest.param(
+                CategoryStatistics,
+                {"category": "Permissive", "count": 1, "percentage": 100.0},
+                id="CategoryStatistics",
+            ),
+            pytest.param(
+                LicenseStatistics,
+                {
+                    "total_packages": 0,
+                    "permissive": _EMPTY_CATEGORY,
+                    "copyleft": _EMPTY_CATEGORY,
+                    "weak_copyleft": _EMPTY_CATEGORY,
+                    "unknown": _EMPTY_CATEGORY,
+                },
+                id="LicenseStatistics",
+            ),
+            pytest.param(
+                CompatibilityMatrix,
+                {"licenses": [], "matrix": [], "issues": []},
+                id="CompatibilityMatrix",
+            ),
+        ],
+    )
+    def test_model_forbids_extra_fields(
+        self, model_cls: type[BaseModel], kwargs: dict[str, Any]
+    ) -> None:
+        """Test that extra fields are forbidden."""
+        _assert_forbids_extra(model_cls, **kwargs)
@@ -120,6 +120,20 @@ class TestScanResult:
 
         assert result.packages == packages
 
+    def test_from_packages_sorts_by_name_case_insensitive(self) -> None:
+        """Test that from_packages stores packages in case-insensitive name order."""
+        packages = [
+            PackageLicense(name="Zlib", version="1.0.0", license="MIT"),
+            PackageLicense(name="aiohttp", version="3.0.0", license="Apache-2.0"),
+            PackageLicense(name="Requests", version="2.28.0", license="MIT"),
+        ]
+
+        result = ScanResult.from_packages(packages)
+
+        assert [pkg.name for pkg in result.packages] == ["aiohttp", "Requests", "Zlib"]
+        # The caller's list is left untouched
+        assert packages[0].name == "Zlib"
+
     def test_has_issues_true_when_issues_exist(self) -> None:
         """Test that has_issues returns True when issues_found > 0."""
         result = ScanResult(
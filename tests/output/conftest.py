@@ -0,0 +1,123 @@
+"""Shared fixtures for output formatter tests."""
+
+import json
+
+import pytest
+
+from license_analyzer.models.dependency import CompatibilityMatrix, CompatibilityResult
+from tests.output.helpers import NO, OK, UNK, ConsoleIO, JsonLoads, capture_console
+
+
+@pytest.fixture(scope="module")
+def console_width() -> int:
+    """Width of the shared capture console; modules may override it."""
+    return 100
+
+
+@pytest.fixture(scope="module")
+def shared_console(console_width: int) -> ConsoleIO:
+    """Plain-text capture console built once per module; use console_io in tests."""
+    return capture_console(console_width)
+
+
+@pytest.fixture
+def console_io(shared_console: ConsoleIO) -> ConsoleIO:
+    """Shared capture console with the previous test's output cleared."""
+    string_io, _ = shared_console
+    string_io.seek(0)
+    string_io.truncate(0)
+    return shared_console
+
+
+@pytest.fixture(scope="session")
+def json_loads() -> JsonLoads:
+    """Return the fastest available JSON parser for formatter output.
+
+    Uses orjson when it is installed (the fast-json extra), otherwise the
+    standard library.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+@pytest.fixture(scope="session")
+def compatible_matrix_3x3() -> CompatibilityMatrix:
+    """Three mutually compatible licenses. Shared; do not mutate."""
+    return CompatibilityMatrix(
+        licenses=["MIT", "Apache-2.0", "BSD-3-Clause"],
+        matrix=[[OK] * 3, [OK] * 3, [OK] * 3],
+        issues=[],
+    )
+
+
+@pytest.fixture(scope="session")
+def incompatible_matrix_3x3() -> CompatibilityMatrix:
+    """MIT incompatible with two copyleft licenses. Shared; do not mutate."""
+    return CompatibilityMatrix(
+        licenses=["MIT", "GPL-3.0", "AGPL-3.0"],
+        matrix=[[OK, NO, NO], [NO, OK, OK], [NO, OK, OK]],
+        issues=[
+            CompatibilityResult(
+                license_a="MIT",
+                license_b="GPL-3.0",
+                status=NO,
+                reason="Test",
+            ),
+            CompatibilityResult(
+                license_a="MIT",
+                license_b="AGPL-3.0",
+                status=NO,
+                reason="Test",
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def unknown_matrix_3x3() -> CompatibilityMatrix:
+    """Three licenses whose pairs are all unknown. Shared; do not mutate."""
+    return CompatibilityMatrix(
+        licenses=["MIT", "Unknown-1", "Unknown-2"],
+        matrix=[[OK, UNK, UNK], [UNK, OK, UNK], [UNK, UNK, OK]],
+        issues=[
+            CompatibilityResult(
+                license_a="MIT",
+                license_b="Unknown-1",
+                status=UNK,
+                reason="Unknown",
+            ),
+            CompatibilityResult(
+                license_a="MIT",
+                license_b="Unknown-2",
+                status=UNK,
+                reason="Unknown",
+            ),
+            CompatibilityResult(
+                license_a="Unknown-1",
+                license_b="Unknown-2",
+                status=UNK,
+                reason="Unknown",
+            ),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def large_matrix() -> CompatibilityMatrix:
+    """Symmetric 200x200 matrix cycling through every status. Shared.
+
+    Cell (i, j) off the diagonal is ``(OK, NO, UNK)[(i + j) % 3]``.
+    """
+    cycle = (OK, NO, UNK)
+    size = 200
+    return CompatibilityMatrix(
+        licenses=[f"License-{i}" for i in range(size)],
+        matrix=[
+            [OK if i == j else cycle[(i + j) % 3] for j in range(size)]
+            for i in range(size)
+        ],
+        issues=[],
+    )
@@ -0,0 +1,77 @@
+"""Helpers shared by the output formatter test modules."""
+
+import re
+from collections.abc import Sequence
+from io import StringIO
+from typing import Any, Callable, Optional
+
+from rich.console import Console
+
+from license_analyzer.models.dependency import (
+    CompatibilityMatrix,
+    CompatibilityStatus,
+    DependencyNode,
+)
+
+# Capture buffer and the console writing to it
+ConsoleIO = tuple[StringIO, Console]
+# Parser returned by the json_loads fixture
+JsonLoads = Callable[[str], Any]
+
+# Short names keep matrix literals readable
+OK = CompatibilityStatus.COMPATIBLE
+NO = CompatibilityStatus.INCOMPATIBLE
+UNK = CompatibilityStatus.UNKNOWN
+
+# Matches a "| Metric | Value |" row of a markdown summary table
+_SUMMARY_ROW_RE = re.compile(r"^\| (?P<metric>[^|]+?) \| (?P<value>\d+) \|$", re.M)
+
+
+def missing(output: str, tokens: Sequence[str]) -> list[str]:
+    """Return the tokens that do not appear in output, in the given order."""
+    return [token for token in tokens if token not in output]
+
+
+def marker_order(output: str, markers: Sequence[str]) -> list[str]:
+    """Return markers in the order they first appear in output.
+
+    Scans output once; markers that never appear are left out, so comparing
+    against the expected order also catches missing sections.
+    """
+    pattern = re.compile("|".join(map(re.escape, markers)))
+    first_seen: dict[str, None] = {}
+    for match in pattern.finditer(output):
+        first_seen.setdefault(match.group(), None)
+    return list(first_seen)
+
+
+def summary_value(output: str, metric: str) -> str:
+    """Return the markdown summary table value for ``metric``."""
+    values = {m["metric"]: m["value"] for m in _SUMMARY_ROW_RE.finditer(output)}
+    return values[metric]
+
+
+def leaf(name: str, version: str, depth: int, license: Optional[str]) -> DependencyNode:
+    """Build a new childless dependency node."""
+    return DependencyNode(name=name, version=version, depth=depth, license=license)
+
+
+def capture_console(width: int = 100) -> ConsoleIO:
+    """Build a console that records plain text of the given width.
+
+    Output is plain text with no highlighting, so Rich neither runs its
+    highlighter regexes nor renders styles to ANSI codes. Markup stays on:
+    the formatters emit Rich markup tags.
+    """
+    string_io = StringIO()
+    console = Console(file=string_io, width=width, color_system=None, highlight=False)
+    return string_io, console
+
+
+def status_matrix(status: CompatibilityStatus) -> CompatibilityMatrix:
+    """Build a 2x2 matrix whose off-diagonal cells carry ``status``."""
+    return CompatibilityMatrix(
+        licenses=["MIT", "Other-License"],
+        matrix=[[OK, status], [status, OK]],
+        issues=[],
+    )
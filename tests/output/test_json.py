@@ -0,0 +1,48 @@
+"""Tests for the JSON serialization helper shared by the JSON formatters."""
+
+import json
+from io import StringIO
+from typing import Any, Optional
+
+import pytest
+
+from license_analyzer.output import _json
+
+_DATA: dict[str, Any] = {
+    "name": "café-utils",
+    "license": "Licence Art Libre — © Ünïcode 😀",
+    "homepage": "https://example.org/café",
+    "has_license": True,
+    "override_reason": None,
+    "classifiers": [],
+}
+
+
+@pytest.mark.parametrize("backend", ("orjson", "ujson", "rapidjson", None))
+def test_backends_emit_stdlib_text(backend: Optional[str]) -> None:
+    """Every backend writes exactly json.dumps(indent=2) text, pure ASCII."""
+    if backend is None:
+        encode, encode_to = _json._select_encoder(())
+    else:
+        pytest.importorskip(backend)
+        encode, encode_to = _json._select_encoder((backend,))
+    stream = StringIO()
+    encode_to(_DATA, stream)
+
+    expected = json.dumps(_DATA, indent=2)
+    assert encode(_DATA) == expected
+    assert stream.getvalue() == expected
+    assert expected.isascii()
+
+
+def test_missing_backend_is_skipped(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A backend that cannot be imported falls through to the standard library."""
+
+    def not_installed() -> Any:
+        raise ImportError("not installed")
+
+    monkeypatch.setitem(_json._ENCODERS, "missing", not_installed)
+
+    encode, encode_to = _json._select_encoder(("missing",))
+
+    assert (encode, encode_to) == (_json._stdlib_dumps, _json._stdlib_dump)
@@ -18,7 +18,7 @@ class TestMatrixFormatter:
     def test_format_empty_matrix(self) -> None:
         """Test formatting empty matrix shows message."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(licenses=[], matrix=[], issues=[])
@@ -30,7 +30,7 @@ class TestMatrixFormatter:
     def test_format_single_license(self) -> None:
         """Test formatting matrix with single license."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -49,7 +49,7 @@ class TestMatrixFormatter:
     def test_format_multiple_licenses(self) -> None:
         """Test formatting matrix with multiple licenses."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -73,7 +73,7 @@ class TestMatrixFormatterStatusDisplay:
     def test_compatible_shows_checkmark(self) -> None:
         """Test compatible status shows checkmark."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -90,7 +90,7 @@ class TestMatrixFormatterStatusDisplay:
     def test_incompatible_shows_x(self) -> None:
         """Test incompatible status shows X."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -116,7 +116,7 @@ class TestMatrixFormatterStatusDisplay:
     def test_unknown_shows_question(self) -> None:
         """Test unknown status shows question mark."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -146,7 +146,7 @@ class TestMatrixFormatterLegend:
     def test_legend_displayed(self) -> None:
         """Test legend is displayed."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -169,7 +169,7 @@ class TestMatrixFormatterSummary:
     def test_summary_shows_total(self) -> None:
         """Test summary shows total licenses."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -189,7 +189,7 @@ class TestMatrixFormatterSummary:
     def test_summary_shows_incompatible_count(self) -> None:
         """Test summary shows incompatible pair count."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -219,7 +219,7 @@ class TestMatrixFormatterIssues:
     def test_issues_displayed_when_present(self) -> None:
         """Test issues are displayed when there are incompatibilities."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -247,7 +247,7 @@ class TestMatrixFormatterIssues:
     def test_no_issues_section_when_clean(self) -> None:
         """Test no issues section when all compatible."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         matrix = CompatibilityMatrix(
@@ -271,7 +271,7 @@ class TestMatrixFormatterTruncation:
     def test_long_license_name_truncated(self) -> None:
         """Test long license names are truncated."""
         output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        console = Console(file=output, width=100, color_system=None)
         formatter = MatrixFormatter(console=console)
 
         long_license = "Very-Long-License-Name-That-Exceeds-Limit"
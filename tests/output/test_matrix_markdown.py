@@ -1,43 +1,60 @@
 """Tests for Markdown matrix formatter."""
 
+import pytest
+
 from license_analyzer.models.dependency import (
     CompatibilityMatrix,
     CompatibilityResult,
     CompatibilityStatus,
 )
 from license_analyzer.output.matrix_markdown import MatrixMarkdownFormatter
+from tests.output.helpers import status_matrix, summary_value
+
+
+@pytest.fixture(scope="module")
+def md_formatter(request: pytest.FixtureRequest) -> MatrixMarkdownFormatter:
+    """Shared formatter instance, one per use_emoji variant.
+
+    Parametrize indirectly with a bool to pick use_emoji; without a
+    parameter the formatter is built with its defaults.
+    """
+    if hasattr(request, "param"):
+        return MatrixMarkdownFormatter(use_emoji=request.param)
+    return MatrixMarkdownFormatter()
+
+
+@pytest.fixture(scope="module")
+def mit_markdown(md_formatter: MatrixMarkdownFormatter) -> str:
+    """Markdown for a single compatible MIT license, rendered once per module."""
+    matrix = CompatibilityMatrix(
+        licenses=["MIT"],
+        matrix=[[CompatibilityStatus.COMPATIBLE]],
+        issues=[],
+    )
+    return md_formatter.format_matrix(matrix)
 
 
 class TestMatrixMarkdownFormatter:
     """Tests for MatrixMarkdownFormatter class."""
 
-    def test_format_empty_matrix(self) -> None:
+    def test_format_empty_matrix(self, md_formatter: MatrixMarkdownFormatter) -> None:
         """Test formatting empty matrix shows message."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(licenses=[], matrix=[], issues=[])
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         assert "# License Compatibility Matrix" in result
         assert "No licenses found" in result
 
-    def test_format_single_license(self) -> None:
+    def test_format_single_license(self, mit_markdown: str) -> None:
         """Test formatting matrix with single license."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
+        assert "MIT" in mit_markdown
+        assert "## Compatibility Matrix" in mit_markdown
 
-        assert "MIT" in result
-        assert "## Compatibility Matrix" in result
-
-    def test_format_multiple_licenses(self) -> None:
+    def test_format_multiple_licenses(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test formatting matrix with multiple licenses."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "Apache-2.0"],
             matrix=[
@@ -47,150 +64,83 @@ class TestMatrixMarkdownFormatter:
             issues=[],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         assert "MIT" in result
         assert "Apache-2.0" in result
 
 
+@pytest.mark.parametrize("md_formatter", [True], indirect=True)
 class TestMatrixMarkdownFormatterEmoji:
     """Tests for emoji indicators."""
 
-    def test_compatible_shows_checkmark_emoji(self) -> None:
-        """Test compatible status shows checkmark emoji."""
-        formatter = MatrixMarkdownFormatter(use_emoji=True)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert ":white_check_mark:" in result
-
-    def test_incompatible_shows_x_emoji(self) -> None:
-        """Test incompatible status shows X emoji."""
-        formatter = MatrixMarkdownFormatter(use_emoji=True)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT", "GPL-3.0"],
-            matrix=[
-                [CompatibilityStatus.COMPATIBLE, CompatibilityStatus.INCOMPATIBLE],
-                [CompatibilityStatus.INCOMPATIBLE, CompatibilityStatus.COMPATIBLE],
-            ],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert ":x:" in result
-
-    def test_unknown_shows_question_emoji(self) -> None:
-        """Test unknown status shows question emoji."""
-        formatter = MatrixMarkdownFormatter(use_emoji=True)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT", "Unknown"],
-            matrix=[
-                [CompatibilityStatus.COMPATIBLE, CompatibilityStatus.UNKNOWN],
-                [CompatibilityStatus.UNKNOWN, CompatibilityStatus.COMPATIBLE],
-            ],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert ":question:" in result
-
-
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            (CompatibilityStatus.COMPATIBLE, ":white_check_mark:"),
+            (CompatibilityStatus.INCOMPATIBLE, ":x:"),
+            (CompatibilityStatus.UNKNOWN, ":question:"),
+        ],
+    )
+    def test_status_shows_emoji(
+        self,
+        md_formatter: MatrixMarkdownFormatter,
+        status: CompatibilityStatus,
+        expected: str,
+    ) -> None:
+        """Test each status shows its emoji indicator."""
+        result = md_formatter.format_matrix(status_matrix(status))
+
+        assert expected in result
+
+
+@pytest.mark.parametrize("md_formatter", [False], indirect=True)
 class TestMatrixMarkdownFormatterAscii:
     """Tests for ASCII fallback indicators."""
 
-    def test_ascii_compatible_shows_ok(self) -> None:
-        """Test ASCII mode shows OK for compatible."""
-        formatter = MatrixMarkdownFormatter(use_emoji=False)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "OK" in result
-        assert ":white_check_mark:" not in result
-
-    def test_ascii_incompatible_shows_no(self) -> None:
-        """Test ASCII mode shows NO for incompatible."""
-        formatter = MatrixMarkdownFormatter(use_emoji=False)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT", "GPL-3.0"],
-            matrix=[
-                [CompatibilityStatus.COMPATIBLE, CompatibilityStatus.INCOMPATIBLE],
-                [CompatibilityStatus.INCOMPATIBLE, CompatibilityStatus.COMPATIBLE],
-            ],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "NO" in result
-        assert ":x:" not in result
-
-    def test_ascii_unknown_shows_question_marks(self) -> None:
-        """Test ASCII mode shows ?? for unknown."""
-        formatter = MatrixMarkdownFormatter(use_emoji=False)
-        matrix = CompatibilityMatrix(
-            licenses=["MIT", "Unknown"],
-            matrix=[
-                [CompatibilityStatus.COMPATIBLE, CompatibilityStatus.UNKNOWN],
-                [CompatibilityStatus.UNKNOWN, CompatibilityStatus.COMPATIBLE],
-            ],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "??" in result
-        assert ":question:" not in result
+    @pytest.mark.parametrize(
+        ("status", "expected", "emoji"),
+        [
+            (CompatibilityStatus.COMPATIBLE, "OK", ":white_check_mark:"),
+            (CompatibilityStatus.INCOMPATIBLE, "NO", ":x:"),
+            (CompatibilityStatus.UNKNOWN, "??", ":question:"),
+        ],
+    )
+    def test_status_shows_ascii(
+        self,
+        md_formatter: MatrixMarkdownFormatter,
+        status: CompatibilityStatus,
+        expected: str,
+        emoji: str,
+    ) -> None:
+        """Test ASCII mode shows text indicators instead of emoji."""
+        result = md_formatter.format_matrix(status_matrix(status))
+
+        assert expected in result
+        assert emoji not in result
 
 
 class TestMatrixMarkdownFormatterSummary:
     """Tests for summary section."""
 
-    def test_summary_section_present(self) -> None:
+    def test_summary_section_present(self, mit_markdown: str) -> None:
         """Test summary section is present."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
+        assert "## Summary" in mit_markdown
 
-        assert "## Summary" in result
-
-    def test_summary_shows_total_licenses(self) -> None:
+    def test_summary_shows_total_licenses(
+        self,
+        md_formatter: MatrixMarkdownFormatter,
+        compatible_matrix_3x3: CompatibilityMatrix,
+    ) -> None:
         """Test summary shows total license count."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT", "Apache-2.0", "BSD-3-Clause"],
-            matrix=[
-                [CompatibilityStatus.COMPATIBLE] * 3,
-                [CompatibilityStatus.COMPATIBLE] * 3,
-                [CompatibilityStatus.COMPATIBLE] * 3,
-            ],
-            issues=[],
-        )
+        result = md_formatter.format_matrix(compatible_matrix_3x3)
 
-        result = formatter.format_matrix(matrix)
+        assert summary_value(result, "Total Licenses") == "3"
 
-        assert "Total Licenses" in result
-        assert "3" in result
-
-    def test_summary_shows_incompatible_count(self) -> None:
+    def test_summary_shows_incompatible_count(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test summary shows incompatible pair count."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "GPL-3.0"],
             matrix=[
@@ -207,14 +157,14 @@ class TestMatrixMarkdownFormatterSummary:
             ],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
-        assert "Incompatible Pairs" in result
-        assert "1" in result
+        assert summary_value(result, "Incompatible Pairs") == "1"
 
-    def test_summary_shows_unknown_count(self) -> None:
+    def test_summary_shows_unknown_count(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test summary shows unknown pair count."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "Unknown-License"],
             matrix=[
@@ -231,51 +181,32 @@ class TestMatrixMarkdownFormatterSummary:
             ],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
-        assert "Unknown Pairs" in result
+        assert summary_value(result, "Unknown Pairs") == "1"
 
-    def test_summary_has_status_badge(self) -> None:
+    def test_summary_has_status_badge(self, mit_markdown: str) -> None:
         """Test summary includes status badge."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "![Status]" in result
-        assert "shields.io" in result
+        assert "![Status]" in mit_markdown
+        assert "shields.io" in mit_markdown
 
 
 class TestMatrixMarkdownFormatterLegend:
     """Tests for legend section."""
 
-    def test_legend_section_present(self) -> None:
+    def test_legend_section_present(self, mit_markdown: str) -> None:
         """Test legend section is present."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "## Legend" in result
-        assert "Compatible" in result
-        assert "Incompatible" in result
-        assert "Unknown" in result
+        assert "## Legend" in mit_markdown
+        assert "Compatible" in mit_markdown
+        assert "Incompatible" in mit_markdown
+        assert "Unknown" in mit_markdown
 
 
 class TestMatrixMarkdownFormatterTable:
     """Tests for table formatting."""
 
-    def test_table_has_headers(self) -> None:
+    def test_table_has_headers(self, md_formatter: MatrixMarkdownFormatter) -> None:
         """Test table has header row."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "Apache-2.0"],
             matrix=[
@@ -285,32 +216,24 @@ class TestMatrixMarkdownFormatterTable:
             issues=[],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         # Check for table structure
         assert "| |" in result  # Header starts with empty cell
         assert "|---|" in result  # Separator row
 
-    def test_table_has_row_headers(self) -> None:
+    def test_table_has_row_headers(self, mit_markdown: str) -> None:
         """Test table has bold row headers."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
-
-        result = formatter.format_matrix(matrix)
-
-        assert "**MIT**" in result
+        assert "**MIT**" in mit_markdown
 
 
 class TestMatrixMarkdownFormatterIssues:
     """Tests for issues section."""
 
-    def test_issues_section_present_when_issues(self) -> None:
+    def test_issues_section_present_when_issues(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test issues section is present when there are issues."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "GPL-3.0"],
             matrix=[
@@ -327,13 +250,14 @@ class TestMatrixMarkdownFormatterIssues:
             ],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         assert "## Compatibility Issues" in result
 
-    def test_issues_section_absent_when_clean(self) -> None:
+    def test_issues_section_absent_when_clean(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test issues section is absent when all compatible."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "Apache-2.0"],
             matrix=[
@@ -343,13 +267,14 @@ class TestMatrixMarkdownFormatterIssues:
             issues=[],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         assert "## Compatibility Issues" not in result
 
-    def test_issues_table_includes_details(self) -> None:
+    def test_issues_table_includes_details(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test issues table includes license names and reasons."""
-        formatter = MatrixMarkdownFormatter()
         matrix = CompatibilityMatrix(
             licenses=["MIT", "GPL-3.0"],
             matrix=[
@@ -366,7 +291,7 @@ class TestMatrixMarkdownFormatterIssues:
             ],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         assert "MIT" in result
         assert "GPL-3.0" in result
@@ -377,9 +302,10 @@ class TestMatrixMarkdownFormatterIssues:
 class TestMatrixMarkdownFormatterTruncation:
     """Tests for license name truncation."""
 
-    def test_long_license_name_truncated(self) -> None:
+    def test_long_license_name_truncated(
+        self, md_formatter: MatrixMarkdownFormatter
+    ) -> None:
         """Test long license names are truncated."""
-        formatter = MatrixMarkdownFormatter()
         long_license = "Very-Long-License-Name-That-Exceeds-Limit"
         matrix = CompatibilityMatrix(
             licenses=[long_license],
@@ -387,7 +313,7 @@ class TestMatrixMarkdownFormatterTruncation:
             issues=[],
         )
 
-        result = formatter.format_matrix(matrix)
+        result = md_formatter.format_matrix(matrix)
 
         # Should be truncated with ..
         assert ".." in result
@@ -400,15 +326,24 @@ class TestMatrixMarkdownFormatterTruncation:
 class TestMatrixMarkdownFormatterDefaultEmoji:
     """Tests for default emoji setting."""
 
-    def test_default_uses_emoji(self) -> None:
+    def test_default_uses_emoji(self, mit_markdown: str) -> None:
         """Test default formatter uses emoji."""
-        formatter = MatrixMarkdownFormatter()
-        matrix = CompatibilityMatrix(
-            licenses=["MIT"],
-            matrix=[[CompatibilityStatus.COMPATIBLE]],
-            issues=[],
-        )
+        assert ":white_check_mark:" in mit_markdown
+
+
+class TestMatrixMarkdownFormatterLargeMatrix:
+    """Tests for formatting a large matrix."""
 
-        result = formatter.format_matrix(matrix)
+    def test_large_matrix_renders_every_row(
+        self,
+        md_formatter: MatrixMarkdownFormatter,
+        large_matrix: CompatibilityMatrix,
+    ) -> None:
+        """Test a 200x200 matrix renders one full table row per license."""
+        result = md_formatter.format_matrix(large_matrix)
 
-        assert ":white_check_mark:" in result
+        rows = [line for line in result.splitlines() if line.startswith("| **")]
+        assert len(rows) == large_matrix.size
+        # Row label cell plus one cell per column
+        assert all(row.count(" |") == large_matrix.size + 1 for row in rows)
+        assert summary_value(result, "Total Licenses") == str(large_matrix.size)
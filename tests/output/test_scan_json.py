@@ -1,51 +1,126 @@
 """Tests for JSON scan result formatter."""
 
-import json
+import io
 import re
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional, Union
 
+import pytest
+
+from license_analyzer import __version__
 from license_analyzer.constants import LEGAL_DISCLAIMER
+from license_analyzer.models.policy import PolicyViolation
 from license_analyzer.models.scan import (
     IgnoredPackagesSummary,
     PackageLicense,
     ScanResult,
 )
 from license_analyzer.output.scan_json import ScanJsonFormatter
+from tests.output.helpers import JsonLoads
+
+ScanData = dict[str, Any]
+
+# ISO 8601 UTC timestamp as emitted by the formatter: YYYY-MM-DDTHH:MM:SSZ
+_ISO8601_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
+# Lowercase words joined by single underscores; rejects "Foo_Bar", "a__b", "a_"
+_SNAKE_CASE_RE = re.compile(r"[a-z][a-z0-9]*(?:_[a-z0-9]+)*")
+
+# Keys of the top-level object in two-space indented output
+_TOP_LEVEL_KEY_RE = re.compile(r'^  "(\w+)":', re.M)
+
+
+def _walk_keys(obj: Any, path: str = "") -> Iterator[tuple[str, str]]:
+    """Yield (path, key) for every object key in a parsed JSON document."""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            yield path, key
+            yield from _walk_keys(value, f"{path}.{key}")
+    elif isinstance(obj, list):
+        for index, item in enumerate(obj):
+            yield from _walk_keys(item, f"{path}[{index}]")
+
+
+def _packages(
+    names: Sequence[str],
+    versions: Sequence[str],
+    licenses: Sequence[Optional[str]],
+) -> list[PackageLicense]:
+    """Build packages from parallel columns, skipping model validation.
+
+    For trusted literal test inputs only.
+    """
+    return [
+        PackageLicense.model_construct(name=name, version=version, license=license)
+        for name, version, license in zip(names, versions, licenses)
+    ]
+
+
+@pytest.fixture(scope="module")
+def json_formatter() -> ScanJsonFormatter:
+    """Shared formatter instance; ScanJsonFormatter holds no state."""
+    return ScanJsonFormatter()
+
+
+# The shared fixtures parse the formatted JSON text once per module, so the
+# tests using them check the public JSON output, not the intermediate dict.
+
+
+@pytest.fixture(scope="module")
+def click_data(json_formatter: ScanJsonFormatter, json_loads: JsonLoads) -> ScanData:
+    """Output for a single licensed package. Shared; do not mutate."""
+    result = ScanResult.from_packages(
+        [PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause")]
+    )
+    return json_loads(json_formatter.format_scan_result(result))
+
+
+@pytest.fixture(scope="module")
+def unknown_data(json_formatter: ScanJsonFormatter, json_loads: JsonLoads) -> ScanData:
+    """Output for one package without a license. Shared; do not mutate."""
+    result = ScanResult.from_packages(
+        [PackageLicense(name="unknown", version="1.0.0", license=None)]
+    )
+    return json_loads(json_formatter.format_scan_result(result))
+
+
+@pytest.fixture(scope="module")
+def empty_data(json_formatter: ScanJsonFormatter, json_loads: JsonLoads) -> ScanData:
+    """Output for a scan with no packages. Shared; do not mutate."""
+    result = ScanResult(packages=[], total_packages=0, issues_found=0)
+    return json_loads(json_formatter.format_scan_result(result))
 
 
 class TestScanJsonFormatter:
     """Tests for ScanJsonFormatter class."""
 
-    def test_format_empty_result(self) -> None:
+    def test_format_empty_result(self, empty_data: ScanData) -> None:
         """Test formatting empty result returns valid JSON."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult(packages=[], total_packages=0, issues_found=0)
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        assert empty_data["packages"] == []
+        assert empty_data["summary"]["total_packages"] == 0
 
-        assert data["packages"] == []
-        assert data["summary"]["total_packages"] == 0
-
-    def test_format_single_package(self) -> None:
+    def test_format_single_package(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test formatting result with single package."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="requests", version="2.28.0", license="Apache-2.0"),
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert len(data["packages"]) == 1
         assert data["packages"][0]["name"] == "requests"
         assert data["packages"][0]["version"] == "2.28.0"
         assert data["packages"][0]["license"] == "Apache-2.0"
 
-    def test_format_multiple_packages(self) -> None:
+    def test_format_multiple_packages(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test formatting result with multiple packages."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -53,14 +128,15 @@ class TestScanJsonFormatter:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert len(data["packages"]) == 2
 
-    def test_output_is_valid_json(self) -> None:
-        """Test output is always valid parseable JSON."""
-        formatter = ScanJsonFormatter()
+    def test_output_is_valid_json(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
+        """Test output parses back to exactly the built output structure."""
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -68,100 +144,120 @@ class TestScanJsonFormatter:
             ]
         )
 
-        output = formatter.format_scan_result(result)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
+        expected = json_formatter._build_output(result)
 
-        # Should not raise
-        data = json.loads(output)
-        assert isinstance(data, dict)
+        # generated_at is stamped per call and may differ between the two
+        data["scan_metadata"].pop("generated_at")
+        expected["scan_metadata"].pop("generated_at")
+        assert data == expected
 
-    def test_output_is_pretty_printed(self) -> None:
-        """Test output is indented for readability."""
-        formatter = ScanJsonFormatter()
+    def test_write_scan_result_matches_format(
+        self, json_formatter: ScanJsonFormatter
+    ) -> None:
+        """Test streaming to a text stream writes the same text as formatting."""
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
+                PackageLicense(name="unknown", version="1.0.0", license=None),
             ]
         )
+        stream = io.StringIO()
 
-        output = formatter.format_scan_result(result)
-
-        # Pretty printed JSON has newlines and indentation
-        assert "\n" in output
-        assert "  " in output
-
+        json_formatter.write_scan_result(result, stream)
+        output = json_formatter.format_scan_result(result)
 
-class TestScanJsonFormatterMetadata:
-    """Tests for scan_metadata section."""
+        # generated_at is stamped per call and may differ between the two
+        assert _ISO8601_RE.sub("", stream.getvalue()) == _ISO8601_RE.sub("", output)
 
-    def test_scan_metadata_present(self) -> None:
-        """Test scan_metadata section is present."""
-        formatter = ScanJsonFormatter()
+    def test_output_is_pretty_printed(self, json_formatter: ScanJsonFormatter) -> None:
+        """Test output is indented for readability."""
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
 
-        assert "scan_metadata" in data
+        # Pretty printed JSON has newlines and indentation
+        assert "\n" in output
+        assert "  " in output
 
-    def test_generated_at_is_iso8601(self) -> None:
-        """Test generated_at timestamp is in ISO 8601 format."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+class TestScanJsonFormatterPassingScan:
+    """Tests for field values when a single licensed package passes."""
 
-        timestamp = data["scan_metadata"]["generated_at"]
-        # ISO 8601 format: YYYY-MM-DDTHH:MM:SSZ
-        iso8601_pattern = r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$"
-        assert re.match(iso8601_pattern, timestamp)
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            pytest.param(("summary", "status"), "pass", id="summary_status_pass"),
+            pytest.param(("summary", "has_issues"), False, id="has_issues_false"),
+            pytest.param(
+                ("summary", "overall_status"), "PASS", id="overall_status_pass"
+            ),
+            pytest.param(
+                ("summary", "status_message"),
+                "All packages compatible",
+                id="status_message_pass",
+            ),
+            pytest.param(
+                ("packages", 0, "has_license"), True, id="package_has_license_true"
+            ),
+            pytest.param(
+                ("scan_metadata", "tool_version"),
+                __version__,
+                id="tool_version_matches_package_version",
+            ),
+            pytest.param(
+                ("scan_metadata", "disclaimer"),
+                LEGAL_DISCLAIMER,
+                id="disclaimer_matches_constant",
+            ),
+            pytest.param(
+                ("scan_metadata", "disclaimer_type"),
+                "informational",
+                id="disclaimer_type_is_informational",
+            ),
+        ],
+    )
+    def test_click_fields(
+        self, click_data: ScanData, path: tuple[Union[str, int], ...], expected: Any
+    ) -> None:
+        """Test each field along path holds the expected value and type."""
+        value: Any = click_data
+        for key in path:
+            value = value[key]
 
-    def test_tool_version_present(self) -> None:
-        """Test tool_version is present in metadata."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
+        assert value == expected
+        assert type(value) is type(expected)
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
 
-        assert "tool_version" in data["scan_metadata"]
-        # Version should be a valid semver string
-        assert isinstance(data["scan_metadata"]["tool_version"], str)
-        assert len(data["scan_metadata"]["tool_version"]) > 0
+class TestScanJsonFormatterMetadata:
+    """Tests for scan_metadata section."""
 
+    def test_generated_at_is_iso8601(self, click_data: ScanData) -> None:
+        """Test generated_at timestamp is in ISO 8601 format."""
+        timestamp = click_data["scan_metadata"]["generated_at"]
 
-class TestScanJsonFormatterSummary:
-    """Tests for summary section."""
+        assert _ISO8601_RE.fullmatch(timestamp)
 
-    def test_summary_section_present(self) -> None:
-        """Test summary section is present."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
+    def test_tool_version_present(self, click_data: ScanData) -> None:
+        """Test tool_version is present in metadata."""
+        assert "tool_version" in click_data["scan_metadata"]
+        # Version should be a valid semver string
+        assert isinstance(click_data["scan_metadata"]["tool_version"], str)
+        assert len(click_data["scan_metadata"]["tool_version"]) > 0
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
 
-        assert "summary" in data
+class TestScanJsonFormatterSummary:
+    """Tests for summary section."""
 
-    def test_summary_total_packages(self) -> None:
+    def test_summary_total_packages(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test summary shows total package count."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -170,14 +266,15 @@ class TestScanJsonFormatterSummary:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["total_packages"] == 3
 
-    def test_summary_licenses_found(self) -> None:
+    def test_summary_licenses_found(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test summary shows licenses found count."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -185,14 +282,15 @@ class TestScanJsonFormatterSummary:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["licenses_found"] == 1
 
-    def test_summary_issues_found(self) -> None:
+    def test_summary_issues_found(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test summary shows issues found count."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -200,184 +298,89 @@ class TestScanJsonFormatterSummary:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["issues_found"] == 1
 
-    def test_summary_status_pass(self) -> None:
-        """Test summary status is 'pass' when no issues."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["status"] == "pass"
-
-    def test_summary_status_issues_found(self) -> None:
+    def test_summary_status_issues_found(self, unknown_data: ScanData) -> None:
         """Test summary status is 'issues_found' when issues exist."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        assert unknown_data["summary"]["status"] == "issues_found"
 
-        assert data["summary"]["status"] == "issues_found"
-
-    def test_summary_has_issues_flag_true(self) -> None:
+    def test_summary_has_issues_flag_true(self, unknown_data: ScanData) -> None:
         """Test summary has_issues is true when issues exist."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["has_issues"] is True
-
-    def test_summary_has_issues_flag_false(self) -> None:
-        """Test summary has_issues is false when no issues."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["has_issues"] is False
+        assert unknown_data["summary"]["has_issues"] is True
 
 
 class TestScanJsonFormatterPackages:
     """Tests for packages array."""
 
-    def test_packages_array_present(self) -> None:
+    def test_packages_array_present(self, click_data: ScanData) -> None:
         """Test packages array is present."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
+        assert "packages" in click_data
+        assert isinstance(click_data["packages"], list)
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "packages" in data
-        assert isinstance(data["packages"], list)
-
-    def test_packages_sorted_alphabetically(self) -> None:
+    def test_packages_sorted_alphabetically(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test packages are sorted alphabetically by name."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="zlib", version="1.0.0", license="MIT"),
-                PackageLicense(name="aiohttp", version="3.0.0", license="Apache-2.0"),
-                PackageLicense(name="requests", version="2.28.0", license="MIT"),
-            ]
+        # Not from_packages, which presorts: exercise the formatter sort
+        result = ScanResult(
+            packages=_packages(
+                ["zlib", "aiohttp", "requests"],
+                ["1.0.0", "3.0.0", "2.28.0"],
+                ["MIT", "Apache-2.0", "MIT"],
+            ),
+            total_packages=3,
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         names = [pkg["name"] for pkg in data["packages"]]
         assert names == ["aiohttp", "requests", "zlib"]
 
-    def test_packages_sorted_case_insensitive(self) -> None:
+    def test_packages_sorted_case_insensitive(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test packages are sorted case-insensitively."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="Zlib", version="1.0.0", license="MIT"),
-                PackageLicense(name="aiohttp", version="3.0.0", license="Apache-2.0"),
-                PackageLicense(name="Requests", version="2.28.0", license="MIT"),
-            ]
+        # Not from_packages, which presorts: exercise the formatter sort
+        result = ScanResult(
+            packages=_packages(
+                ["Zlib", "aiohttp", "Requests"],
+                ["1.0.0", "3.0.0", "2.28.0"],
+                ["MIT", "Apache-2.0", "MIT"],
+            ),
+            total_packages=3,
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         names = [pkg["name"] for pkg in data["packages"]]
         assert names == ["aiohttp", "Requests", "Zlib"]
 
-    def test_package_has_license_true(self) -> None:
-        """Test has_license is true when license exists."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["packages"][0]["has_license"] is True
-
-    def test_package_has_license_false(self) -> None:
+    def test_package_has_license_false(self, unknown_data: ScanData) -> None:
         """Test has_license is false when license is None."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
+        assert unknown_data["packages"][0]["has_license"] is False
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["packages"][0]["has_license"] is False
-
-    def test_package_license_null_in_json(self) -> None:
+    def test_package_license_null_in_json(self, unknown_data: ScanData) -> None:
         """Test license is null in JSON when not found."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["packages"][0]["license"] is None
+        assert unknown_data["packages"][0]["license"] is None
 
 
 class TestScanJsonFormatterIssues:
     """Tests for issues array."""
 
-    def test_issues_array_present(self) -> None:
+    def test_issues_array_present(self, click_data: ScanData) -> None:
         """Test issues array is present."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
+        assert "issues" in click_data
+        assert isinstance(click_data["issues"], list)
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "issues" in data
-        assert isinstance(data["issues"], list)
-
-    def test_issues_array_empty_when_no_issues(self) -> None:
+    def test_issues_array_empty_when_no_issues(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test issues array is empty when all packages have licenses."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -385,68 +388,40 @@ class TestScanJsonFormatterIssues:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["issues"] == []
 
-    def test_issues_array_populated_when_issues(self) -> None:
+    def test_issues_array_populated_when_issues(self, unknown_data: ScanData) -> None:
         """Test issues array contains issues when packages have no license."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        assert len(unknown_data["issues"]) == 1
+        assert unknown_data["issues"][0]["package"] == "unknown"
+        assert unknown_data["issues"][0]["version"] == "1.0.0"
 
-        assert len(data["issues"]) == 1
-        assert data["issues"][0]["package"] == "unknown"
-        assert data["issues"][0]["version"] == "1.0.0"
-
-    def test_issue_has_type(self) -> None:
+    def test_issue_has_type(self, unknown_data: ScanData) -> None:
         """Test issue has issue_type field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        assert unknown_data["issues"][0]["issue_type"] == "no_license"
 
-        assert data["issues"][0]["issue_type"] == "no_license"
-
-    def test_issue_has_suggestion(self) -> None:
+    def test_issue_has_suggestion(self, unknown_data: ScanData) -> None:
         """Test issue has suggestion field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "suggestion" in data["issues"][0]
-        assert "Check package documentation" in data["issues"][0]["suggestion"]
+        assert "suggestion" in unknown_data["issues"][0]
+        assert "Check package documentation" in unknown_data["issues"][0]["suggestion"]
 
-    def test_issues_sorted_alphabetically(self) -> None:
+    def test_issues_sorted_alphabetically(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test issues are sorted alphabetically by package name."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="zlib-unknown", version="1.0.0", license=None),
-                PackageLicense(name="aiohttp-unknown", version="3.0.0", license=None),
-            ]
+        # Not from_packages, which presorts: exercise the formatter sort
+        result = ScanResult(
+            packages=_packages(
+                ["zlib-unknown", "aiohttp-unknown"], ["1.0.0", "3.0.0"], [None, None]
+            ),
+            total_packages=2,
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         packages = [issue["package"] for issue in data["issues"]]
         assert packages == ["aiohttp-unknown", "zlib-unknown"]
@@ -455,177 +430,60 @@ class TestScanJsonFormatterIssues:
 class TestScanJsonFormatterSnakeCase:
     """Tests for snake_case field naming."""
 
-    def test_all_top_level_fields_snake_case(self) -> None:
-        """Test all top-level fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        for key in data:
-            assert "_" in key or key.islower(), f"Key '{key}' is not snake_case"
-
-    def test_scan_metadata_fields_snake_case(self) -> None:
-        """Test scan_metadata fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "generated_at" in data["scan_metadata"]
-        assert "tool_version" in data["scan_metadata"]
-        # Verify no camelCase
-        assert "generatedAt" not in data["scan_metadata"]
-        assert "toolVersion" not in data["scan_metadata"]
-
-    def test_summary_fields_snake_case(self) -> None:
-        """Test summary fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        expected_fields = [
-            "total_packages",
-            "licenses_found",
-            "issues_found",
-            "has_issues",
-        ]
-        for field in expected_fields:
-            assert field in data["summary"], f"Missing field: {field}"
-
-        # Verify no camelCase
-        camel_case_fields = [
-            "totalPackages",
-            "licensesFound",
-            "issuesFound",
-            "hasIssues",
-        ]
-        for field in camel_case_fields:
-            assert field not in data["summary"], f"Found camelCase: {field}"
-
-    def test_package_fields_snake_case(self) -> None:
-        """Test package fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
+    def test_all_keys_snake_case(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
+        """Test every key in a fully populated document uses snake_case."""
+        result = ScanResult(
+            packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "has_license" in data["packages"][0]
-        assert "hasLicense" not in data["packages"][0]
-
-    def test_issue_fields_snake_case(self) -> None:
-        """Test issue fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
                 PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
+            ],
+            total_packages=2,
+            issues_found=1,
+            policy_violations=[
+                PolicyViolation(
+                    package_name="click",
+                    package_version="8.1.0",
+                    detected_license="BSD-3-Clause",
+                    reason="Test",
+                )
+            ],
+            ignored_packages_summary=IgnoredPackagesSummary(
+                ignored_count=1, ignored_names=["pip"]
+            ),
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        data = json_loads(json_formatter.format_scan_result(result))
+        keys = list(_walk_keys(data))
 
-        assert "issue_type" in data["issues"][0]
-        assert "issueType" not in data["issues"][0]
+        for path, key in keys:
+            assert _SNAKE_CASE_RE.fullmatch(key), (
+                f"Key '{path}.{key}' is not snake_case"
+            )
+        # Every section was populated, so the walk reached its fields
+        assert {
+            ("", "scan_metadata"),
+            (".scan_metadata", "generated_at"),
+            (".summary", "total_packages"),
+            (".summary.ignored_packages", "names"),
+            (".packages[0]", "has_license"),
+            (".issues[0]", "issue_type"),
+            (".policy_violations[0]", "package_name"),
+        } <= set(keys)
 
 
 class TestScanJsonFormatterExecutiveSummary:
     """Tests for executive summary fields in JSON output."""
 
-    def test_summary_has_overall_status(self) -> None:
-        """Test summary includes overall_status field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "overall_status" in data["summary"]
-
-    def test_summary_has_status_message(self) -> None:
-        """Test summary includes status_message field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "status_message" in data["summary"]
-
-    def test_overall_status_pass(self) -> None:
-        """Test overall_status is PASS when no issues."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["overall_status"] == "PASS"
-
-    def test_overall_status_issues_found(self) -> None:
+    def test_overall_status_issues_found(self, unknown_data: ScanData) -> None:
         """Test overall_status is ISSUES_FOUND when issues exist."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
-        )
+        assert unknown_data["summary"]["overall_status"] == "ISSUES_FOUND"
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["overall_status"] == "ISSUES_FOUND"
-
-    def test_status_message_pass(self) -> None:
-        """Test status_message when no issues."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["status_message"] == "All packages compatible"
-
-    def test_status_message_issues_found(self) -> None:
+    def test_status_message_issues_found(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test status_message when issues exist."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="unknown1", version="1.0.0", license=None),
@@ -633,214 +491,102 @@ class TestScanJsonFormatterExecutiveSummary:
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["status_message"] == "2 issue(s) require attention"
 
-    def test_status_fields_snake_case(self) -> None:
+    def test_status_fields_snake_case(self, click_data: ScanData) -> None:
         """Test executive summary fields use snake_case."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
         # Verify snake_case fields
-        assert "overall_status" in data["summary"]
-        assert "status_message" in data["summary"]
+        assert "overall_status" in click_data["summary"]
+        assert "status_message" in click_data["summary"]
         # Verify no camelCase
-        assert "overallStatus" not in data["summary"]
-        assert "statusMessage" not in data["summary"]
+        assert "overallStatus" not in click_data["summary"]
+        assert "statusMessage" not in click_data["summary"]
 
-    def test_existing_summary_fields_preserved(self) -> None:
+    def test_existing_summary_fields_preserved(self, click_data: ScanData) -> None:
         """Test existing summary fields are still present."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
         # All existing fields should still be present
-        assert "total_packages" in data["summary"]
-        assert "licenses_found" in data["summary"]
-        assert "issues_found" in data["summary"]
-        assert "status" in data["summary"]
-        assert "has_issues" in data["summary"]
+        assert "total_packages" in click_data["summary"]
+        assert "licenses_found" in click_data["summary"]
+        assert "issues_found" in click_data["summary"]
+        assert "status" in click_data["summary"]
+        assert "has_issues" in click_data["summary"]
 
 
 class TestScanJsonFormatterEdgeCases:
     """Tests for edge cases."""
 
-    def test_empty_string_license_treated_as_no_license(self) -> None:
+    def test_empty_string_license_treated_as_no_license(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test empty string license is treated as no license (has_license=False)."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="pkg-empty-license", version="1.0.0", license=""),
             ]
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         # Empty string license should be treated as no license
         assert data["packages"][0]["has_license"] is False
         assert data["packages"][0]["license"] == ""
 
-    def test_section_order_in_output(self) -> None:
+    def test_section_order_in_output(self, json_formatter: ScanJsonFormatter) -> None:
         """Test JSON sections appear in logical order."""
-        formatter = ScanJsonFormatter()
         result = ScanResult.from_packages(
             [
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
             ]
         )
 
-        output = formatter.format_scan_result(result)
+        output = json_formatter.format_scan_result(result)
 
         # Verify sections appear in expected order
-        scan_metadata_pos = output.find('"scan_metadata"')
-        summary_pos = output.find('"summary"')
-        packages_pos = output.find('"packages"')
-        issues_pos = output.find('"issues"')
-
-        assert scan_metadata_pos < summary_pos < packages_pos < issues_pos
-
-    def test_tool_version_matches_package_version(self) -> None:
-        """Test tool_version uses actual package version."""
-        from license_analyzer import __version__
-
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["scan_metadata"]["tool_version"] == __version__
+        sections = _TOP_LEVEL_KEY_RE.findall(output)
+
+        assert sections == [
+            "scan_metadata",
+            "summary",
+            "packages",
+            "issues",
+            "policy_violations",
+        ]
 
-    def test_status_message_no_packages_scanned(self) -> None:
+    def test_status_message_no_packages_scanned(self, empty_data: ScanData) -> None:
         """Test status_message when no packages scanned."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult(packages=[], total_packages=0, issues_found=0)
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        assert empty_data["summary"]["overall_status"] == "PASS"
+        assert empty_data["summary"]["status_message"] == "No packages scanned"
 
-        assert data["summary"]["overall_status"] == "PASS"
-        assert data["summary"]["status_message"] == "No packages scanned"
-
-    def test_status_message_singular_issue(self) -> None:
+    def test_status_message_singular_issue(self, unknown_data: ScanData) -> None:
         """Test status_message with single issue uses correct pluralization."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
+        assert (
+            unknown_data["summary"]["status_message"] == "1 issue(s) require attention"
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["summary"]["status_message"] == "1 issue(s) require attention"
-
 
 class TestScanJsonFormatterDisclaimer:
     """Tests for legal disclaimer in JSON output."""
 
-    def test_metadata_has_disclaimer(self) -> None:
-        """Test scan_metadata includes disclaimer field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "disclaimer" in data["scan_metadata"]
-
-    def test_metadata_has_disclaimer_type(self) -> None:
-        """Test scan_metadata includes disclaimer_type field."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert "disclaimer_type" in data["scan_metadata"]
-
-    def test_disclaimer_matches_constant(self) -> None:
-        """Test disclaimer text matches the LEGAL_DISCLAIMER constant."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["scan_metadata"]["disclaimer"] == LEGAL_DISCLAIMER
-
-    def test_disclaimer_type_is_informational(self) -> None:
-        """Test disclaimer_type value is 'informational'."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
-        assert data["scan_metadata"]["disclaimer_type"] == "informational"
-
-    def test_disclaimer_fields_snake_case(self) -> None:
+    def test_disclaimer_fields_snake_case(self, click_data: ScanData) -> None:
         """Test disclaimer fields use snake_case naming."""
-        formatter = ScanJsonFormatter()
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
-
         # Verify snake_case fields
-        assert "disclaimer" in data["scan_metadata"]
-        assert "disclaimer_type" in data["scan_metadata"]
+        assert "disclaimer" in click_data["scan_metadata"]
+        assert "disclaimer_type" in click_data["scan_metadata"]
         # Verify no camelCase
-        assert "disclaimerType" not in data["scan_metadata"]
+        assert "disclaimerType" not in click_data["scan_metadata"]
 
 
 class TestScanJsonFormatterIgnoredPackages:
     """Tests for ignored packages in JSON output (FR24)."""
 
-    def test_ignored_packages_in_summary(self) -> None:
+    def test_ignored_packages_in_summary(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test that ignored_packages appears in summary when packages ignored."""
-        formatter = ScanJsonFormatter()
         result = ScanResult(
             packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -853,16 +599,17 @@ class TestScanJsonFormatterIgnoredPackages:
             ),
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["ignored_packages"] is not None
         assert data["summary"]["ignored_packages"]["count"] == 2
         assert data["summary"]["ignored_packages"]["names"] == ["pkg1", "pkg2"]
 
-    def test_ignored_packages_null_when_none(self) -> None:
+    def test_ignored_packages_null_when_none(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test that ignored_packages is null when no summary."""
-        formatter = ScanJsonFormatter()
         result = ScanResult(
             packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -872,14 +619,15 @@ class TestScanJsonFormatterIgnoredPackages:
             ignored_packages_summary=None,
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["ignored_packages"] is None
 
-    def test_ignored_packages_null_when_zero_count(self) -> None:
+    def test_ignored_packages_null_when_zero_count(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test that ignored_packages is null when count is 0."""
-        formatter = ScanJsonFormatter()
         result = ScanResult(
             packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -892,14 +640,15 @@ class TestScanJsonFormatterIgnoredPackages:
             ),
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["ignored_packages"] is None
 
-    def test_ignored_packages_empty_names_list(self) -> None:
+    def test_ignored_packages_empty_names_list(
+        self, json_formatter: ScanJsonFormatter, json_loads: JsonLoads
+    ) -> None:
         """Test ignored_packages with count but None names uses empty list."""
-        formatter = ScanJsonFormatter()
         result = ScanResult(
             packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
@@ -912,8 +661,8 @@ class TestScanJsonFormatterIgnoredPackages:
             ),
         )
 
-        output = formatter.format_scan_result(result)
-        data = json.loads(output)
+        output = json_formatter.format_scan_result(result)
+        data = json_loads(output)
 
         assert data["summary"]["ignored_packages"]["count"] == 2
         assert data["summary"]["ignored_packages"]["names"] == []
@@ -1,21 +1,80 @@
 """Tests for terminal formatter."""
 
+from collections.abc import Sequence
 from io import StringIO
+from typing import Optional
 
+import pytest
 from rich.console import Console
 
 from license_analyzer.models.scan import (
     IgnoredPackagesSummary,
     PackageLicense,
     ScanResult,
+    Verbosity,
 )
 from license_analyzer.output.terminal import TerminalFormatter
+from tests.output.helpers import ConsoleIO, capture_console, marker_order, missing
+
+
+@pytest.fixture(scope="module")
+def console_width() -> int:
+    """Narrow shared console, overriding the conftest width.
+
+    Most tests only look for tokens in small tables; tests that depend on
+    text staying on one line render at full width instead.
+    """
+    return 60
+
+
+@pytest.fixture(scope="module")
+def empty_output(console_width: int) -> str:
+    """Terminal output for a scan with no packages, rendered once per module."""
+    string_io, console = capture_console(console_width)
+    result = ScanResult(packages=[], total_packages=0, issues_found=0)
+    TerminalFormatter(console=console).format_scan_result(result)
+    return string_io.getvalue()
+
+
+@pytest.fixture(scope="module")
+def click_output() -> str:
+    """Terminal output for a single licensed package, rendered once per module.
+
+    Rendered at full width so the disclaimer sentence is not wrapped.
+    """
+    string_io, console = capture_console(120)
+    result = ScanResult(
+        packages=[
+            PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause")
+        ],
+        total_packages=1,
+        issues_found=0,
+    )
+    TerminalFormatter(console=console).format_scan_result(result)
+    return string_io.getvalue()
+
+
+class TestTerminalFormatterConstruction:
+    """Tests for TerminalFormatter console wiring; these never render."""
+
+    def test_default_console_created(self) -> None:
+        """Test that TerminalFormatter creates a console if not provided."""
+        formatter = TerminalFormatter()
+        assert formatter._console is not None
+
+    def test_custom_console_used(self) -> None:
+        """Test that custom console is used when provided."""
+        string_io = StringIO()
+        custom_console = Console(file=string_io, force_terminal=True)
+
+        formatter = TerminalFormatter(console=custom_console)
+        assert formatter._console is custom_console
 
 
 class TestTerminalFormatter:
     """Tests for TerminalFormatter."""
 
-    def test_formats_packages_as_table(self) -> None:
+    def test_formats_packages_as_table(self, console_io: ConsoleIO) -> None:
         """Test that packages are displayed in a table."""
         result = ScanResult(
             packages=[
@@ -27,20 +86,17 @@ class TestTerminalFormatter:
         )
 
         # Capture Rich output
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
-        assert "click" in output
-        assert "8.1.0" in output
-        assert "BSD-3-Clause" in output
-        assert "pydantic" in output
-        assert "MIT" in output
+        assert not missing(
+            output, ("click", "8.1.0", "BSD-3-Clause", "pydantic", "MIT")
+        )
 
-    def test_handles_none_license(self) -> None:
+    def test_handles_none_license(self, console_io: ConsoleIO) -> None:
         """Test that None license shows as Unknown."""
         result = ScanResult(
             packages=[
@@ -50,8 +106,7 @@ class TestTerminalFormatter:
             issues_found=0,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
@@ -60,20 +115,11 @@ class TestTerminalFormatter:
         assert "unknown-pkg" in output
         assert "Unknown" in output
 
-    def test_empty_packages_shows_message(self) -> None:
+    def test_empty_packages_shows_message(self, empty_output: str) -> None:
         """Test that empty package list shows appropriate message."""
-        result = ScanResult(packages=[], total_packages=0, issues_found=0)
+        assert "No packages found" in empty_output
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "No packages found" in output
-
-    def test_displays_summary_with_totals(self) -> None:
+    def test_displays_summary_with_totals(self, console_io: ConsoleIO) -> None:
         """Test that summary displays total packages and issues."""
         result = ScanResult(
             packages=[
@@ -83,59 +129,31 @@ class TestTerminalFormatter:
             issues_found=3,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "Total packages:" in output
-        assert "1" in output
-        assert "Issues found:" in output
-        assert "3" in output
-
-    def test_table_has_correct_headers(self) -> None:
-        """Test that table has Package, Version, License headers."""
-        result = ScanResult(
-            packages=[
-                PackageLicense(name="click", version="8.1.0", license="MIT"),
-            ],
-            total_packages=1,
-            issues_found=0,
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "Package" in output
-        assert "Version" in output
-        assert "License" in output
-
-    def test_table_title(self) -> None:
-        """Test that table has correct title."""
-        result = ScanResult(
-            packages=[
-                PackageLicense(name="click", version="8.1.0", license="MIT"),
-            ],
-            total_packages=1,
-            issues_found=0,
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
-        assert "License Scan Results" in output
-
-    def test_multiple_packages_all_displayed(self) -> None:
+        assert not missing(output, ("Total packages: 1", "Issues found: 3"))
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            pytest.param("License Scan Results", id="table_title"),
+            pytest.param("Package", id="package_header"),
+            pytest.param("Version", id="version_header"),
+            pytest.param("License", id="license_header"),
+            pytest.param("EXECUTIVE SUMMARY", id="executive_summary"),
+            pytest.param("NOT LEGAL ADVICE", id="disclaimer"),
+            pytest.param("informational purposes", id="disclaimer_text"),
+        ],
+    )
+    def test_render_contains(self, click_output: str, token: str) -> None:
+        """Test the single-package report shows each fixed section and header."""
+        assert token in click_output
+
+    def test_multiple_packages_all_displayed(self, console_io: ConsoleIO) -> None:
         """Test that all packages are displayed in the table."""
         result = ScanResult(
             packages=[
@@ -147,128 +165,67 @@ class TestTerminalFormatter:
             issues_found=0,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
-        assert "package-a" in output
-        assert "package-b" in output
-        assert "package-c" in output
-        assert "MIT" in output
-        assert "Apache-2.0" in output
-        assert "Unknown" in output  # For None license
-
-    def test_default_console_created(self) -> None:
-        """Test that TerminalFormatter creates a console if not provided."""
-        formatter = TerminalFormatter()
-        assert formatter._console is not None
-
-    def test_custom_console_used(self) -> None:
-        """Test that custom console is used when provided."""
-        string_io = StringIO()
-        custom_console = Console(file=string_io, force_terminal=True)
-
-        formatter = TerminalFormatter(console=custom_console)
-        assert formatter._console is custom_console
+        # "Unknown" is shown for the None license
+        assert not missing(
+            output,
+            ("package-a", "package-b", "package-c", "MIT", "Apache-2.0", "Unknown"),
+        )
 
 
 class TestTerminalFormatterExecutiveSummary:
     """Tests for executive summary in terminal output."""
 
-    def test_executive_summary_displayed(self) -> None:
-        """Test executive summary panel is displayed."""
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
+    def test_report_section_order(self, click_output: str) -> None:
+        """Test order is Executive Summary, then Disclaimer, then the table."""
+        sections = ["EXECUTIVE SUMMARY", "NOT LEGAL ADVICE", "License Scan Results"]
+        assert marker_order(click_output, sections) == sections
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "EXECUTIVE SUMMARY" in output
-
-    def test_executive_summary_before_table(self) -> None:
-        """Test executive summary appears before the packages table."""
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        summary_pos = output.find("EXECUTIVE SUMMARY")
-        table_pos = output.find("License Scan Results")
-
-        assert summary_pos < table_pos
-
-    def test_executive_summary_metrics(self) -> None:
+    def test_executive_summary_metrics(self, console_io: ConsoleIO) -> None:
         """Test executive summary includes all metrics."""
-        result = ScanResult.from_packages(
-            [
+        result = ScanResult(
+            packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
                 PackageLicense(name="requests", version="2.28.0", license="Apache-2.0"),
                 PackageLicense(name="unknown", version="1.0.0", license=None),
-            ]
+            ],
+            total_packages=3,
+            issues_found=1,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
 
-        # Check metrics are present
-        assert "Total Packages" in output
-        assert "3" in output
-        assert "Licenses Found" in output
-        assert "2" in output
-        assert "Issues" in output
-
-    def test_executive_summary_status_pass(self) -> None:
-        """Test executive summary shows PASS status with green color."""
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
+        assert not missing(
+            output, ("Total Packages: 3", "Licenses Found: 2", "Issues: 1")
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "PASS" in output
-        assert "All packages compatible" in output
+    def test_executive_summary_status_pass(self, click_output: str) -> None:
+        """Test executive summary shows PASS status."""
+        assert "PASS" in click_output
+        assert "All packages compatible" in click_output
 
-    def test_executive_summary_status_issues(self) -> None:
+    def test_executive_summary_status_issues(self, console_io: ConsoleIO) -> None:
         """Test executive summary shows ISSUES FOUND status."""
-        result = ScanResult.from_packages(
-            [
+        result = ScanResult(
+            packages=[
                 PackageLicense(name="unknown1", version="1.0.0", license=None),
                 PackageLicense(name="unknown2", version="2.0.0", license=None),
-            ]
+            ],
+            total_packages=2,
+            issues_found=2,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
@@ -277,218 +234,125 @@ class TestTerminalFormatterExecutiveSummary:
         assert "ISSUES FOUND" in output
         assert "2 issue(s) require attention" in output
 
-    def test_empty_result_no_executive_summary(self) -> None:
+    def test_empty_result_no_executive_summary(self, empty_output: str) -> None:
         """Test empty result doesn't show executive summary."""
-        result = ScanResult(packages=[], total_packages=0, issues_found=0)
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "EXECUTIVE SUMMARY" not in output
+        assert "EXECUTIVE SUMMARY" not in empty_output
 
 
 class TestTerminalFormatterSorting:
     """Tests for package sorting in terminal output."""
 
-    def test_packages_sorted_alphabetically(self) -> None:
+    def test_packages_sorted_alphabetically(self, console_io: ConsoleIO) -> None:
         """Test packages are sorted alphabetically by name."""
-        result = ScanResult.from_packages(
-            [
+        # Built directly; only the factories presort, so this is unsorted
+        result = ScanResult(
+            packages=[
                 PackageLicense(name="zlib", version="1.0.0", license="MIT"),
                 PackageLicense(name="aiohttp", version="3.0.0", license="Apache-2.0"),
                 PackageLicense(name="requests", version="2.28.0", license="MIT"),
-            ]
+            ],
+            total_packages=3,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
 
-        # Find positions of package names in output
-        aiohttp_pos = output.find("aiohttp")
-        requests_pos = output.find("requests")
-        zlib_pos = output.find("zlib")
+        names = ["aiohttp", "requests", "zlib"]
+        assert marker_order(output, names) == names
 
-        # Should be sorted: aiohttp < requests < zlib
-        assert aiohttp_pos < requests_pos < zlib_pos
+    def test_quiet_missing_licenses_listed_alphabetically(
+        self, console_io: ConsoleIO
+    ) -> None:
+        """Test quiet mode lists unlicensed packages in the factory order.
 
-
-class TestTerminalFormatterDisclaimer:
-    """Tests for legal disclaimer in terminal output."""
-
-    def test_disclaimer_displayed(self) -> None:
-        """Test disclaimer panel is displayed."""
+        The quiet list follows result.packages, so results built with
+        from_packages show it sorted by name rather than in discovery order.
+        """
         result = ScanResult.from_packages(
             [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "NOT LEGAL ADVICE" in output
-
-    def test_disclaimer_after_executive_summary(self) -> None:
-        """Test disclaimer appears after executive summary."""
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
+                PackageLicense(name="zlib", version="1.0.0", license=None),
+                PackageLicense(name="Aiohttp", version="3.0.0", license=None),
+                PackageLicense(name="requests", version="2.28.0", license="MIT"),
+                PackageLicense(name="mypkg", version="0.1.0", license=None),
             ]
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
-        formatter = TerminalFormatter(console=console)
+        formatter = TerminalFormatter(console=console, verbosity=Verbosity.QUIET)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
-        summary_pos = output.find("EXECUTIVE SUMMARY")
-        disclaimer_pos = output.find("NOT LEGAL ADVICE")
-        table_pos = output.find("License Scan Results")
-
-        # Order should be: Executive Summary → Disclaimer → Table
-        assert summary_pos < disclaimer_pos < table_pos
 
-    def test_disclaimer_contains_key_text(self) -> None:
-        """Test disclaimer contains informational purpose text."""
-        result = ScanResult.from_packages(
-            [
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ]
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        names = ["Aiohttp@3.0.0", "mypkg@0.1.0", "zlib@1.0.0"]
+        assert marker_order(output, names) == names
 
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
 
-        output = string_io.getvalue()
-        assert "informational purposes" in output
+class TestTerminalFormatterDisclaimer:
+    """Tests for legal disclaimer in terminal output."""
 
-    def test_empty_result_shows_disclaimer(self) -> None:
+    def test_empty_result_shows_disclaimer(self, empty_output: str) -> None:
         """Test disclaimer is shown even when no packages found."""
-        result = ScanResult(packages=[], total_packages=0, issues_found=0)
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "NOT LEGAL ADVICE" in output
-        assert "No packages found" in output
+        assert "NOT LEGAL ADVICE" in empty_output
+        assert "No packages found" in empty_output
 
 
 class TestTerminalFormatterIgnoredPackages:
     """Tests for ignored packages display in terminal output (FR24)."""
 
-    def test_ignored_packages_shown_in_summary(self) -> None:
-        """Test that ignored packages count and names appear in executive summary."""
-        result = ScanResult(
-            packages=[
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ],
-            total_packages=1,
-            issues_found=0,
-            ignored_packages_summary=IgnoredPackagesSummary(
-                ignored_count=2,
-                ignored_names=["pkg1", "pkg2"],
+    @pytest.mark.parametrize(
+        ("summary", "expected", "forbidden"),
+        [
+            pytest.param(
+                IgnoredPackagesSummary(ignored_count=2, ignored_names=["pkg1", "pkg2"]),
+                ("Packages Ignored: 2", "pkg1", "pkg2"),
+                (),
+                id="shown",
             ),
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "Packages Ignored: 2" in output
-        assert "pkg1" in output
-        assert "pkg2" in output
-
-    def test_ignored_packages_truncated_when_many(self) -> None:
-        """Test that only first 3 package names shown when many ignored."""
-        result = ScanResult(
-            packages=[
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ],
-            total_packages=1,
-            issues_found=0,
-            ignored_packages_summary=IgnoredPackagesSummary(
-                ignored_count=5,
-                ignored_names=["pkg1", "pkg2", "pkg3", "pkg4", "pkg5"],
+            pytest.param(
+                IgnoredPackagesSummary(
+                    ignored_count=5,
+                    ignored_names=["pkg1", "pkg2", "pkg3", "pkg4", "pkg5"],
+                ),
+                ("Packages Ignored: 5", "pkg1", "pkg2", "pkg3", "+2 more"),
+                ("pkg4", "pkg5"),
+                id="truncated_when_many",
             ),
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "Packages Ignored: 5" in output
-        assert "pkg1" in output
-        assert "pkg2" in output
-        assert "pkg3" in output
-        assert "+2 more" in output
-
-    def test_no_ignored_packages_line_when_none_ignored(self) -> None:
-        """Test that no ignored line appears when ignored_packages_summary is None."""
-        result = ScanResult(
-            packages=[
-                PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
-            ],
-            total_packages=1,
-            issues_found=0,
-            ignored_packages_summary=None,
-        )
-
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
-
-        formatter = TerminalFormatter(console=console)
-        formatter.format_scan_result(result)
-
-        output = string_io.getvalue()
-        assert "Packages Ignored" not in output
-
-    def test_no_ignored_packages_line_when_zero_count(self) -> None:
-        """Test that no ignored line appears when count is 0."""
+            pytest.param(None, (), ("Packages Ignored",), id="none"),
+            pytest.param(
+                IgnoredPackagesSummary(ignored_count=0, ignored_names=[]),
+                (),
+                ("Packages Ignored",),
+                id="zero_count",
+            ),
+        ],
+    )
+    def test_ignored_packages_line(
+        self,
+        console_io: ConsoleIO,
+        summary: Optional[IgnoredPackagesSummary],
+        expected: Sequence[str],
+        forbidden: Sequence[str],
+    ) -> None:
+        """Test the ignored line lists up to 3 names and is omitted when empty."""
         result = ScanResult(
             packages=[
                 PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
             ],
             total_packages=1,
             issues_found=0,
-            ignored_packages_summary=IgnoredPackagesSummary(
-                ignored_count=0,
-                ignored_names=[],
-            ),
+            ignored_packages_summary=summary,
         )
 
-        string_io = StringIO()
-        console = Console(file=string_io, force_terminal=True, width=120)
+        string_io, console = console_io
 
         formatter = TerminalFormatter(console=console)
         formatter.format_scan_result(result)
 
         output = string_io.getvalue()
-        assert "Packages Ignored" not in output
+        assert not missing(output, expected)
+        assert missing(output, forbidden) == list(forbidden)
@@ -1,7 +1,8 @@
 """Tests for tree output formatter."""
 
-from io import StringIO
+import re
 
+import pytest
 from rich.console import Console
 
 from license_analyzer.models.dependency import (
@@ -10,6 +11,33 @@ from license_analyzer.models.dependency import (
     DependencyTree,
 )
 from license_analyzer.output.tree import TreeFormatter
+from tests.output.helpers import ConsoleIO, leaf, missing
+
+# Summary lines such as "Total packages: 2" or "  Permissive: 1 (50.0%)"
+_STAT_RE = re.compile(
+    r"^ *(?P<label>[A-Z][\w ]*): (?P<value>\d+)(?: \((?P<percentage>[\d.]+)%\))?$",
+    re.M,
+)
+
+
+def _stats(output: str) -> dict[str, int]:
+    """Return the value of every labelled summary statistic in output."""
+    return {m["label"]: int(m["value"]) for m in _STAT_RE.finditer(output)}
+
+
+def _category_percentages(output: str) -> dict[str, float]:
+    """Return the percentage shown for each license category, in order."""
+    return {
+        m["label"]: float(m["percentage"])
+        for m in _STAT_RE.finditer(output)
+        if m["percentage"] is not None
+    }
+
+
+@pytest.fixture(scope="module")
+def label_formatter() -> TreeFormatter:
+    """Shared formatter for _format_node_label, which never prints."""
+    return TreeFormatter()
 
 
 class TestTreeFormatter:
@@ -26,10 +54,9 @@ class TestTreeFormatter:
         formatter = TreeFormatter(console=console)
         assert formatter._console is console
 
-    def test_format_empty_tree(self) -> None:
+    def test_format_empty_tree(self, console_io: ConsoleIO) -> None:
         """Test formatting empty tree shows message."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=80)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
         tree = DependencyTree(roots=[])
@@ -38,33 +65,25 @@ class TestTreeFormatter:
         result = output.getvalue()
         assert "No dependencies found" in result
 
-    def test_format_single_root(self) -> None:
+    def test_format_single_root(self, console_io: ConsoleIO) -> None:
         """Test formatting tree with single root node."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(
-            name="requests", version="2.31.0", depth=0, license="Apache-2.0"
-        )
+        root = leaf("requests", "2.31.0", 0, "Apache-2.0")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "requests@2.31.0" in result
-        assert "Apache-2.0" in result
-        assert "Total packages:" in result
-        assert "1" in result
+        assert not missing(result, ("requests@2.31.0", "Apache-2.0"))
+        assert _stats(result)["Total packages"] == 1
 
-    def test_format_nested_tree(self) -> None:
+    def test_format_nested_tree(self, console_io: ConsoleIO) -> None:
         """Test formatting tree with nested children."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        grandchild = DependencyNode(
-            name="idna", version="3.4", depth=2, license="BSD-3-Clause"
-        )
+        grandchild = leaf("idna", "3.4", 2, "BSD-3-Clause")
         child = DependencyNode(
             name="urllib3",
             version="2.0.0",
@@ -83,38 +102,31 @@ class TestTreeFormatter:
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "requests@2.31.0" in result
-        assert "urllib3@2.0.0" in result
-        assert "idna@3.4" in result
-        assert "Max depth:" in result
-        assert "2" in result
+        assert not missing(result, ("requests@2.31.0", "urllib3@2.0.0", "idna@3.4"))
+        assert _stats(result)["Max depth"] == 2
 
 
 class TestTreeFormatterLicenseColors:
     """Tests for license color coding."""
 
-    def test_permissive_license_shown(self) -> None:
+    def test_permissive_license_shown(self, console_io: ConsoleIO) -> None:
         """Test permissive licenses are displayed."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
+        root = leaf("pkg", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
         assert "MIT" in result
 
-    def test_weak_copyleft_license_shown(self) -> None:
+    def test_weak_copyleft_license_shown(self, console_io: ConsoleIO) -> None:
         """Test weak copyleft licenses (LGPL, MPL) are displayed correctly."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(
-            name="lgpl-pkg", version="1.0.0", depth=0, license="LGPL-3.0"
-        )
+        root = leaf("lgpl-pkg", "1.0.0", 0, "LGPL-3.0")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
@@ -123,31 +135,25 @@ class TestTreeFormatterLicenseColors:
         # LGPL is problematic, so should show warning and be in problematic list
         assert "Problematic licenses:" in result
 
-    def test_problematic_license_has_warning(self) -> None:
+    def test_problematic_license_has_warning(self, console_io: ConsoleIO) -> None:
         """Test problematic licenses show warning marker."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
+        root = leaf("gpl-pkg", "1.0.0", 0, "GPL-3.0")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
         assert "GPL-3.0" in result
-        assert "Problematic licenses:" in result
-        # Should show count of 1
-        assert "1" in result
+        assert _stats(result)["Problematic licenses"] == 1
 
-    def test_unknown_license_shown(self) -> None:
+    def test_unknown_license_shown(self, console_io: ConsoleIO) -> None:
         """Test unknown/None licenses show as Unknown."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="mystery", version="1.0.0", depth=0, license=None)
+        root = leaf("mystery", "1.0.0", 0, None)
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
@@ -158,10 +164,9 @@ class TestTreeFormatterLicenseColors:
 class TestTreeFormatterCircularDependencies:
     """Tests for circular dependency display."""
 
-    def test_circular_reference_marker_shown(self) -> None:
+    def test_circular_reference_marker_shown(self, console_io: ConsoleIO) -> None:
         """Test circular references show marker."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
         root = DependencyNode(
@@ -179,34 +184,30 @@ class TestTreeFormatterCircularDependencies:
 
         result = output.getvalue()
         # Should show circular marker
-        assert "↺" in result
-        assert "Circular dependencies:" in result
+        assert not missing(result, ("↺", "Circular dependencies:"))
 
-    def test_no_circular_references_shows_zero(self) -> None:
+    def test_no_circular_references_shows_zero(self, console_io: ConsoleIO) -> None:
         """Test no circular references shows 0 count."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
+        root = leaf("pkg", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Circular dependencies:" in result
-        assert "0" in result
+        assert _stats(result)["Circular dependencies"] == 0
 
 
 class TestTreeFormatterSummary:
     """Tests for summary statistics."""
 
-    def test_summary_shows_total_count(self) -> None:
+    def test_summary_shows_total_count(self, console_io: ConsoleIO) -> None:
         """Test summary shows correct total count."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        child = DependencyNode(name="child", version="1.0.0", depth=1, license="MIT")
+        child = leaf("child", "1.0.0", 1, "MIT")
         root = DependencyNode(
             name="root",
             version="1.0.0",
@@ -218,29 +219,24 @@ class TestTreeFormatterSummary:
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Total packages:" in result
-        # Total should be 2
-        assert "2" in result
+        assert _stats(result)["Total packages"] == 2
 
-    def test_summary_shows_direct_deps_count(self) -> None:
+    def test_summary_shows_direct_deps_count(self, console_io: ConsoleIO) -> None:
         """Test summary shows direct dependencies count."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root1 = DependencyNode(name="pkg-a", version="1.0.0", depth=0, license="MIT")
-        root2 = DependencyNode(name="pkg-b", version="1.0.0", depth=0, license="MIT")
+        root1 = leaf("pkg-a", "1.0.0", 0, "MIT")
+        root2 = leaf("pkg-b", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root1, root2])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Direct dependencies:" in result
-        # Should show 2 direct deps
+        assert _stats(result)["Direct dependencies"] == 2
 
-    def test_summary_shows_problematic_paths(self) -> None:
+    def test_summary_shows_problematic_paths(self, console_io: ConsoleIO) -> None:
         """Test summary shows problematic license paths."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
         gpl_child = DependencyNode(
@@ -261,45 +257,42 @@ class TestTreeFormatterSummary:
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Problematic licenses:" in result
         # Should show the path
-        assert "root-pkg" in result
-        assert "gpl-pkg" in result
+        assert not missing(result, ("Problematic licenses:", "root-pkg", "gpl-pkg"))
 
 
 class TestTreeFormatterNodeLabel:
     """Tests for node label formatting."""
 
-    def test_format_node_label_basic(self) -> None:
+    def test_format_node_label_basic(self, label_formatter: TreeFormatter) -> None:
         """Test basic node label format."""
-        formatter = TreeFormatter()
-        node = DependencyNode(name="requests", version="2.31.0", depth=0, license="MIT")
+        node = leaf("requests", "2.31.0", 0, "MIT")
 
-        label = formatter._format_node_label(node)
+        label = label_formatter._format_node_label(node)
 
         assert "requests@2.31.0" in label
         assert "MIT" in label
 
-    def test_format_node_label_with_warning(self) -> None:
+    def test_format_node_label_with_warning(
+        self, label_formatter: TreeFormatter
+    ) -> None:
         """Test node label includes warning for problematic license."""
-        formatter = TreeFormatter()
-        node = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
+        node = leaf("gpl-pkg", "1.0.0", 0, "GPL-3.0")
 
-        label = formatter._format_node_label(node)
+        label = label_formatter._format_node_label(node)
 
         assert "gpl-pkg@1.0.0" in label
         assert "GPL-3.0" in label
         # Should have warning marker
         assert "⚠" in label
 
-    def test_format_node_label_unknown_license(self) -> None:
+    def test_format_node_label_unknown_license(
+        self, label_formatter: TreeFormatter
+    ) -> None:
         """Test node label shows Unknown for None license."""
-        formatter = TreeFormatter()
-        node = DependencyNode(name="mystery", version="1.0.0", depth=0, license=None)
+        node = leaf("mystery", "1.0.0", 0, None)
 
-        label = formatter._format_node_label(node)
+        label = label_formatter._format_node_label(node)
 
         assert "mystery@1.0.0" in label
         assert "Unknown" in label
@@ -308,67 +301,54 @@ class TestTreeFormatterNodeLabel:
 class TestTreeFormatterLicenseCategories:
     """Tests for license category display."""
 
-    def test_license_categories_section_displayed(self) -> None:
+    def test_license_categories_section_displayed(self, console_io: ConsoleIO) -> None:
         """Test license categories section appears in output."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
+        root = leaf("pkg", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
         assert "License Categories:" in result
 
-    def test_license_categories_shows_permissive(self) -> None:
+    def test_license_categories_shows_permissive(self, console_io: ConsoleIO) -> None:
         """Test permissive category is shown with count."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
+        root = leaf("pkg", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Permissive" in result
-        assert "100" in result  # 100%
+        assert _category_percentages(result) == {"Permissive": 100.0}
 
-    def test_license_categories_shows_mixed_categories(self) -> None:
+    def test_license_categories_shows_mixed_categories(
+        self, console_io: ConsoleIO
+    ) -> None:
         """Test mixed license categories are all shown."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        mit_node = DependencyNode(
-            name="mit-pkg", version="1.0.0", depth=0, license="MIT"
-        )
-        gpl_node = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
+        mit_node = leaf("mit-pkg", "1.0.0", 0, "MIT")
+        gpl_node = leaf("gpl-pkg", "1.0.0", 0, "GPL-3.0")
         tree = DependencyTree(roots=[mit_node, gpl_node])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
-        assert "Permissive" in result
-        assert "Copyleft" in result
-        assert "50" in result  # 50% each
+        assert _category_percentages(result) == {"Permissive": 50.0, "Copyleft": 50.0}
 
-    def test_license_categories_only_shows_nonzero(self) -> None:
+    def test_license_categories_only_shows_nonzero(self, console_io: ConsoleIO) -> None:
         """Test only non-zero categories are displayed."""
-        output = StringIO()
-        console = Console(file=output, force_terminal=True, width=100)
+        output, console = console_io
         formatter = TreeFormatter(console=console)
 
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
+        root = leaf("pkg", "1.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root])
         formatter.format_dependency_tree(tree)
 
         result = output.getvalue()
         # Should show Permissive but not others
-        assert "Permissive" in result
-        # Count of 0 lines that mention Copyleft - it should not appear at all
-        lines = result.split("\n")
-        copyleft_lines = [line for line in lines if "Copyleft:" in line and "1" in line]
-        assert len(copyleft_lines) == 0
+        assert list(_category_percentages(result)) == ["Permissive"]
@@ -1,48 +1,100 @@
 """Tests for Markdown tree output formatter."""
 
+import re
+from collections.abc import Sequence
+
+import pytest
+
 from license_analyzer.models.dependency import (
     CircularReference,
     DependencyNode,
     DependencyTree,
 )
 from license_analyzer.output.tree_markdown import TreeMarkdownFormatter
+from tests.output.helpers import leaf, missing
+
+# Tree branches and the warning and circular markers placed next to nodes
+_MARKER_RE = re.compile("|".join(map(re.escape, ("├──", "└──", "⚠️", "↺"))))
+
+
+def _markers(output: str) -> set[str]:
+    """Return the tree and node markers present in output, found in one scan."""
+    return set(_MARKER_RE.findall(output))
+
+
+def _lines(output: str) -> set[str]:
+    """Return the distinct lines of output, for whole-line assertions."""
+    return set(output.splitlines())
+
+
+@pytest.fixture(scope="module")
+def md_formatter() -> TreeMarkdownFormatter:
+    """Shared formatter instance; TreeMarkdownFormatter holds no state."""
+    return TreeMarkdownFormatter()
+
+
+# Reports for the tree shapes several tests share, rendered once per module.
+
+
+@pytest.fixture(scope="module")
+def requests_markdown(md_formatter: TreeMarkdownFormatter) -> str:
+    """Report for a single Apache-2.0 root."""
+    root = leaf("requests", "2.31.0", 0, "Apache-2.0")
+    return md_formatter.format_dependency_tree(DependencyTree(roots=[root]))
+
+
+@pytest.fixture(scope="module")
+def mit_markdown(md_formatter: TreeMarkdownFormatter) -> str:
+    """Report for a single permissive MIT root."""
+    root = leaf("mit-pkg", "1.0.0", 0, "MIT")
+    return md_formatter.format_dependency_tree(DependencyTree(roots=[root]))
+
+
+@pytest.fixture(scope="module")
+def gpl_markdown(md_formatter: TreeMarkdownFormatter) -> str:
+    """Report for a single problematic GPL-3.0 root."""
+    root = leaf("gpl-pkg", "1.0.0", 0, "GPL-3.0")
+    return md_formatter.format_dependency_tree(DependencyTree(roots=[root]))
+
+
+@pytest.fixture(scope="module")
+def circular_markdown(md_formatter: TreeMarkdownFormatter) -> str:
+    """Report for one root with a circular reference back to pkg-b."""
+    root = DependencyNode(
+        name="pkg-a",
+        version="1.0.0",
+        depth=0,
+        license="MIT",
+        circular_references=["pkg-b"],
+    )
+    circ_ref = CircularReference(
+        from_package="pkg-a", to_package="pkg-b", path=["pkg-a", "pkg-b"]
+    )
+    tree = DependencyTree(roots=[root], circular_references=[circ_ref])
+    return md_formatter.format_dependency_tree(tree)
 
 
 class TestTreeMarkdownFormatter:
     """Tests for TreeMarkdownFormatter class."""
 
-    def test_format_empty_tree(self) -> None:
+    def test_format_empty_tree(self, md_formatter: TreeMarkdownFormatter) -> None:
         """Test formatting empty tree shows message."""
-        formatter = TreeMarkdownFormatter()
         tree = DependencyTree(roots=[])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
-        assert "# Dependency Tree" in result
-        assert "*No dependencies found.*" in result
+        assert not missing(result, ("# Dependency Tree", "*No dependencies found.*"))
 
-    def test_format_single_root(self) -> None:
+    def test_format_single_root(self, requests_markdown: str) -> None:
         """Test formatting tree with single root node."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="requests", version="2.31.0", depth=0, license="Apache-2.0"
+        assert not missing(
+            requests_markdown,
+            ("# Dependency Tree", "**requests**@2.31.0", "Apache-2.0", "## Summary"),
         )
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
 
-        assert "# Dependency Tree" in result
-        assert "**requests**@2.31.0" in result
-        assert "Apache-2.0" in result
-        assert "## Summary" in result
-
-    def test_format_nested_tree(self) -> None:
+    def test_format_nested_tree(self, md_formatter: TreeMarkdownFormatter) -> None:
         """Test formatting tree with nested children."""
-        formatter = TreeMarkdownFormatter()
-
-        grandchild = DependencyNode(
-            name="idna", version="3.4", depth=2, license="BSD-3-Clause"
-        )
+        grandchild = leaf("idna", "3.4", 2, "BSD-3-Clause")
         child = DependencyNode(
             name="urllib3",
             version="2.0.0",
@@ -59,88 +111,73 @@ class TestTreeMarkdownFormatter:
         )
         tree = DependencyTree(roots=[root])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
         # Check all packages appear
-        assert "requests" in result
-        assert "urllib3" in result
-        assert "idna" in result
+        assert not missing(result, ("requests", "urllib3", "idna"))
         # Check tree structure characters
-        assert "└──" in result or "├──" in result
+        assert _markers(result) & {"├──", "└──"}
 
-    def test_format_multiple_roots(self) -> None:
+    def test_format_multiple_roots(self, md_formatter: TreeMarkdownFormatter) -> None:
         """Test formatting tree with multiple root packages."""
-        formatter = TreeMarkdownFormatter()
-
-        root1 = DependencyNode(
-            name="requests", version="2.31.0", depth=0, license="Apache-2.0"
-        )
-        root2 = DependencyNode(
-            name="click", version="8.1.0", depth=0, license="BSD-3-Clause"
-        )
-        root3 = DependencyNode(name="pydantic", version="2.0.0", depth=0, license="MIT")
+        root1 = leaf("requests", "2.31.0", 0, "Apache-2.0")
+        root2 = leaf("click", "8.1.0", 0, "BSD-3-Clause")
+        root3 = leaf("pydantic", "2.0.0", 0, "MIT")
         tree = DependencyTree(roots=[root1, root2, root3])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
         # Check all roots appear
-        assert "requests" in result
-        assert "click" in result
-        assert "pydantic" in result
-        # First two roots should use ├── (not last)
-        assert "├──" in result
-        # Last root should use └── (is last)
-        assert "└──" in result
+        assert not missing(result, ("requests", "click", "pydantic"))
+        # First two roots use ├── (not last), the last root uses └──
+        assert {"├──", "└──"} <= _markers(result)
 
 
 class TestTreeMarkdownFormatterSummary:
     """Tests for summary section in Markdown output."""
 
-    def test_summary_table_present(self) -> None:
+    def test_summary_table_present(self, requests_markdown: str) -> None:
         """Test summary includes markdown table."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="requests", version="2.31.0", depth=0, license="Apache-2.0"
-        )
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "| Metric | Value |" in result
-        assert "| Total Packages |" in result
-        assert "| Max Depth |" in result
-
-    def test_summary_shows_passing_badge_for_clean(self) -> None:
-        """Test passing status badge for no problematic licenses."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="mit-pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "passing" in result
-        assert "green" in result
-
-    def test_summary_shows_failing_badge_for_problematic(self) -> None:
-        """Test failing status badge for problematic licenses."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "failing" in result
-        assert "red" in result
+        assert "| Metric | Value |" in _lines(requests_markdown)
+        assert not missing(requests_markdown, ("| Total Packages |", "| Max Depth |"))
+
+    @pytest.mark.parametrize(
+        ("report", "present", "absent"),
+        [
+            pytest.param(
+                "mit_markdown",
+                ("passing", "green", "## License Categories"),
+                ("failing", "⚠️", "## ⚠️ Problematic Licenses"),
+                id="clean",
+            ),
+            pytest.param(
+                "gpl_markdown",
+                ("failing", "red", "⚠️", "## License Categories"),
+                ("passing",),
+                id="problematic",
+            ),
+        ],
+    )
+    def test_single_root_status(
+        self,
+        request: pytest.FixtureRequest,
+        report: str,
+        present: Sequence[str],
+        absent: Sequence[str],
+    ) -> None:
+        """Test badge, warning marker and sections for a clean and a GPL root."""
+        output = request.getfixturevalue(report)
+        assert not missing(output, present)
+        assert [token for token in absent if token in output] == []
 
 
 class TestTreeMarkdownFormatterProblematic:
     """Tests for problematic section in Markdown output."""
 
-    def test_problematic_section_present(self) -> None:
+    def test_problematic_section_present(
+        self, md_formatter: TreeMarkdownFormatter
+    ) -> None:
         """Test problematic section appears for GPL licenses."""
-        formatter = TreeMarkdownFormatter()
         gpl_node = DependencyNode(
             name="gpl-pkg",
             version="1.0.0",
@@ -157,182 +194,77 @@ class TestTreeMarkdownFormatterProblematic:
         )
         tree = DependencyTree(roots=[root])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
-        assert "## ⚠️ Problematic Licenses" in result
-        assert "gpl-pkg" in result
-        assert "GPL-3.0" in result
+        assert not missing(result, ("## ⚠️ Problematic Licenses", "gpl-pkg", "GPL-3.0"))
 
-    def test_problematic_section_absent_when_clean(self) -> None:
-        """Test no problematic section for permissive licenses."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="mit-pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "## ⚠️ Problematic Licenses" not in result
-
-    def test_problematic_table_format(self) -> None:
+    def test_problematic_table_format(self, gpl_markdown: str) -> None:
         """Test problematic section uses table format."""
-        formatter = TreeMarkdownFormatter()
-        gpl_node = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
-        tree = DependencyTree(roots=[gpl_node])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "| Package | Version | License | Path |" in result
-        assert "| gpl-pkg |" in result
+        assert "| Package | Version | License | Path |" in _lines(gpl_markdown)
+        assert "| gpl-pkg |" in gpl_markdown
 
 
 class TestTreeMarkdownFormatterCircular:
     """Tests for circular dependencies in Markdown output."""
 
-    def test_circular_section_present(self) -> None:
+    def test_circular_section_present(self, circular_markdown: str) -> None:
         """Test circular section appears when circular deps exist."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="pkg-a",
-            version="1.0.0",
-            depth=0,
-            license="MIT",
-            circular_references=["pkg-b"],
-        )
-        circ_ref = CircularReference(
-            from_package="pkg-a", to_package="pkg-b", path=["pkg-a", "pkg-b"]
+        assert not missing(
+            circular_markdown, ("## ↺ Circular Dependencies", "pkg-a", "pkg-b")
         )
-        tree = DependencyTree(roots=[root], circular_references=[circ_ref])
 
-        result = formatter.format_dependency_tree(tree)
-
-        assert "## ↺ Circular Dependencies" in result
-        assert "pkg-a" in result
-        assert "pkg-b" in result
-
-    def test_circular_section_absent_when_none(self) -> None:
+    def test_circular_section_absent_when_none(self, mit_markdown: str) -> None:
         """Test no circular section when no circular deps."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
+        assert "## ↺ Circular Dependencies" not in mit_markdown
 
-        result = formatter.format_dependency_tree(tree)
-
-        assert "## ↺ Circular Dependencies" not in result
-
-    def test_circular_marker_in_tree(self) -> None:
+    def test_circular_marker_in_tree(self, circular_markdown: str) -> None:
         """Test circular marker appears next to node."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="pkg-a",
-            version="1.0.0",
-            depth=0,
-            license="MIT",
-            circular_references=["pkg-b"],
-        )
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "↺" in result
-
-
-class TestTreeMarkdownFormatterWarnings:
-    """Tests for warning markers in Markdown output."""
-
-    def test_warning_marker_for_problematic(self) -> None:
-        """Test warning emoji appears for problematic licenses."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "⚠️" in result
-
-    def test_no_warning_for_permissive(self) -> None:
-        """Test no warning for permissive licenses."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="mit-pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        # Warning should only be in the tree, not in summary for clean tree
-        lines = [line for line in result.split("\n") if "mit-pkg" in line]
-        for line in lines:
-            assert "⚠️" not in line
+        assert "↺" in _markers(circular_markdown)
 
 
 class TestTreeMarkdownFormatterLicenseCategories:
     """Tests for license categories in Markdown output."""
 
-    def test_license_categories_section_present(self) -> None:
-        """Test license categories section is present in output."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "## License Categories" in result
-
-    def test_license_categories_table_format(self) -> None:
+    def test_license_categories_table_format(self, mit_markdown: str) -> None:
         """Test license categories use table format."""
-        formatter = TreeMarkdownFormatter()
-        root = DependencyNode(name="pkg", version="1.0.0", depth=0, license="MIT")
-        tree = DependencyTree(roots=[root])
-
-        result = formatter.format_dependency_tree(tree)
-
-        assert "| Category | Count | Percentage | Licenses |" in result
-        assert "|----------|-------|------------|----------|" in result
-
-    def test_license_categories_shows_values(self) -> None:
+        assert {
+            "| Category | Count | Percentage | Licenses |",
+            "|----------|-------|------------|----------|",
+        } <= _lines(mit_markdown)
+
+    def test_license_categories_shows_values(
+        self, md_formatter: TreeMarkdownFormatter
+    ) -> None:
         """Test license categories show correct values."""
-        formatter = TreeMarkdownFormatter()
-
-        mit_node = DependencyNode(
-            name="mit-pkg", version="1.0.0", depth=0, license="MIT"
-        )
-        gpl_node = DependencyNode(
-            name="gpl-pkg", version="1.0.0", depth=0, license="GPL-3.0"
-        )
+        mit_node = leaf("mit-pkg", "1.0.0", 0, "MIT")
+        gpl_node = leaf("gpl-pkg", "1.0.0", 0, "GPL-3.0")
         tree = DependencyTree(roots=[mit_node, gpl_node])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
         # Check table contains category data
-        assert "| Permissive | 1 | 50.0% |" in result
-        assert "| Copyleft | 1 | 50.0% |" in result
+        assert not missing(
+            result, ("| Permissive | 1 | 50.0% |", "| Copyleft | 1 | 50.0% |")
+        )
 
-    def test_license_categories_shows_license_names(self) -> None:
+    def test_license_categories_shows_license_names(
+        self, md_formatter: TreeMarkdownFormatter
+    ) -> None:
         """Test license categories include license identifiers."""
-        formatter = TreeMarkdownFormatter()
-
-        mit_node = DependencyNode(
-            name="mit-pkg", version="1.0.0", depth=0, license="MIT"
-        )
-        apache_node = DependencyNode(
-            name="apache-pkg", version="1.0.0", depth=0, license="Apache-2.0"
-        )
+        mit_node = leaf("mit-pkg", "1.0.0", 0, "MIT")
+        apache_node = leaf("apache-pkg", "1.0.0", 0, "Apache-2.0")
         tree = DependencyTree(roots=[mit_node, apache_node])
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
         # Should show licenses in the table
-        assert "MIT" in result
-        assert "Apache-2.0" in result
+        assert not missing(result, ("MIT", "Apache-2.0"))
 
-    def test_license_categories_truncates_many_licenses(self) -> None:
+    def test_license_categories_truncates_many_licenses(
+        self, md_formatter: TreeMarkdownFormatter
+    ) -> None:
         """Test license list truncation with many licenses."""
-        formatter = TreeMarkdownFormatter()
-
         # Create nodes with many permissive licenses (>5 to trigger truncation)
-        nodes = []
         licenses = [
             "MIT",
             "Apache-2.0",
@@ -342,13 +274,10 @@ class TestTreeMarkdownFormatterLicenseCategories:
             "Unlicense",
             "CC0-1.0",
         ]
-        for i, lic in enumerate(licenses):
-            nodes.append(
-                DependencyNode(name=f"pkg-{i}", version="1.0.0", depth=0, license=lic)
-            )
+        nodes = [leaf(f"pkg-{i}", "1.0.0", 0, lic) for i, lic in enumerate(licenses)]
         tree = DependencyTree(roots=nodes)
 
-        result = formatter.format_dependency_tree(tree)
+        result = md_formatter.format_dependency_tree(tree)
 
         # Should truncate and show "+N more"
         assert "more)" in result
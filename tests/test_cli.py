@@ -1,6 +1,7 @@
 """CLI behavior tests for license-analyzer."""
 
 from pathlib import Path
+from typing import TextIO
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -12,6 +13,7 @@ from license_analyzer.constants import EXIT_ERROR, EXIT_ISSUES, EXIT_SUCCESS
 from license_analyzer.exceptions import ConfigurationError, NetworkError, ScanError
 from license_analyzer.models.dependency import DependencyNode, DependencyTree
 from license_analyzer.models.scan import PackageLicense
+from license_analyzer.output.scan_json import ScanJsonFormatter
 
 
 def test_cli_help(cli_runner: CliRunner) -> None:
@@ -1548,6 +1550,38 @@ class TestFileOutputUtility:
 
         assert output_file.read_text() == "new content"
 
+    def test_write_output_accepts_writer_function(self, tmp_path: Path) -> None:
+        """Test _write_output_to_file passes the open file to a writer function."""
+        from license_analyzer.cli import _write_output_to_file
+
+        output_file = tmp_path / "test.txt"
+
+        _write_output_to_file(lambda fp: fp.write("streamed café"), str(output_file))
+
+        assert output_file.read_text(encoding="utf-8") == "streamed café"
+        assert (output_file.stat().st_mode & 0o777) == 0o644
+
+    def test_write_output_failed_writer_keeps_existing_file(
+        self, tmp_path: Path
+    ) -> None:
+        """Test a writer error leaves the old file intact and no temp file."""
+        import pytest
+
+        from license_analyzer.cli import _write_output_to_file
+
+        output_file = tmp_path / "test.txt"
+        output_file.write_text("old content")
+
+        def failing_writer(fp: TextIO) -> None:
+            fp.write("partial")
+            raise ValueError("serialization failed")
+
+        with pytest.raises(ValueError, match="serialization failed"):
+            _write_output_to_file(failing_writer, str(output_file))
+
+        assert output_file.read_text() == "old content"
+        assert [p.name for p in tmp_path.iterdir()] == ["test.txt"]
+
     def test_write_output_invalid_path_raises_error(self) -> None:
         """Test _write_output_to_file raises ConfigurationError for invalid path."""
         import pytest
@@ -1639,6 +1673,34 @@ class TestScanOutputOption:
         assert "scan_metadata" in data
         assert "packages" in data
 
+    def test_scan_output_json_streams_to_file(
+        self, cli_runner: CliRunner, tmp_path: Path
+    ) -> None:
+        """Test scan --output with JSON format writes without building a string."""
+        import json
+
+        output_file = tmp_path / "report.json"
+        packages = [
+            PackageLicense(name="click", version="8.1.0", license="BSD-3-Clause"),
+        ]
+
+        mock_resolve = AsyncMock(return_value=packages)
+
+        with (
+            patch("license_analyzer.cli.discover_packages", return_value=packages),
+            patch("license_analyzer.cli.resolve_licenses", mock_resolve),
+            patch.object(
+                ScanJsonFormatter, "format_scan_result", side_effect=AssertionError
+            ),
+        ):
+            result = cli_runner.invoke(
+                main, ["scan", "--format", "json", "--output", str(output_file)]
+            )
+
+        assert result.exit_code == EXIT_SUCCESS
+        data = json.loads(output_file.read_text())
+        assert [pkg["name"] for pkg in data["packages"]] == ["click"]
+
     def test_scan_output_shows_success_message(
         self, cli_runner: CliRunner, tmp_path: Path
     ) -> None:
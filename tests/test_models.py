@@ -1,5 +1,7 @@
 """Tests for Pydantic models."""
 
+from typing import Optional
+
 import pytest
 from pydantic import ValidationError
 
@@ -61,6 +63,19 @@ class TestPackageLicense:
         with pytest.raises(ValidationError):
             PackageLicense(name="click", version="8.1.0", unknown_field="value")  # type: ignore[call-arg]
 
+    @pytest.mark.parametrize(
+        ("license_value", "expected"),
+        [
+            pytest.param("MIT", True, id="license"),
+            pytest.param(None, False, id="none"),
+            pytest.param("", False, id="empty-string"),
+        ],
+    )
+    def test_has_license(self, license_value: Optional[str], expected: bool) -> None:
+        """Test has_license treats None and empty string as no license."""
+        pkg = PackageLicense(name="click", version="8.1.0", license=license_value)
+        assert pkg.has_license is expected
+
     def test_serialization(self) -> None:
         """Test JSON serialization."""
         pkg = PackageLicense(name="click", version="8.1.0", license="MIT")